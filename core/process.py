@@ -80,6 +80,8 @@ class ProcessManager:
         self.threads: Dict[int, Thread] = {}  # 所有线程
         self._next_tid = 1
         self._thread_state_change_callbacks: List[Callable] = []
+        # 数据版本号：进程/线程有任何变化时递增，供界面判断是否需要刷新
+        self.version = 0
 
     def add_state_change_callback(self, callback: Callable):
         """添加状态变化回调"""
@@ -87,6 +89,7 @@ class ProcessManager:
 
     def _notify_state_change(self, process: Process, old_state: ProcessState, new_state: ProcessState):
         """通知状态变化"""
+        self.version += 1
         for callback in self._state_change_callbacks:
             callback(process, old_state, new_state)
 
@@ -208,6 +211,7 @@ class ProcessManager:
 
         self.terminate(pid)
         del self.processes[pid]
+        self.version += 1
         return True
 
     def get_process(self, pid: int) -> Optional[Process]:
@@ -242,6 +246,7 @@ class ProcessManager:
         # 重置线程
         self.threads.clear()
         self._next_tid = 1
+        self.version += 1
 
     # ========== 线程管理方法 ==========
 
@@ -251,6 +256,7 @@ class ProcessManager:
 
     def _notify_thread_state_change(self, thread: Thread, old_state: ThreadState, new_state: ThreadState):
         """通知线程状态变化"""
+        self.version += 1
         for callback in self._thread_state_change_callbacks:
             callback(thread, old_state, new_state)
 
@@ -286,6 +292,7 @@ class ProcessManager:
             if tid in process.threads:
                 process.threads.remove(tid)
         del self.threads[tid]
+        self.version += 1
         return True
 
     def get_thread(self, tid: int) -> Optional[Thread]:
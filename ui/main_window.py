@@ -6,10 +6,61 @@ from PyQt5.QtWidgets import (QMainWindow, QTabWidget, QWidget, QVBoxLayout,
                              QLabel)
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QIcon, QFont
+from functools import partial
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# 帮助对话框内容
+_ABOUT_HTML = """<h2>操作系统原理可视化实验展示平台</h2>
+<p>版本: 2.2.0</p>
+<p>本平台用于展示操作系统核心原理：</p>
+<ul>
+    <li>进程与线程的创建与管理</li>
+    <li>进程间通信（IPC）机制</li>
+    <li>基于信号量的进程同步</li>
+    <li>CPU调度算法</li>
+    <li>动态内存分配与页面置换</li>
+    <li>系统任务管理器</li>
+</ul>
+<p>技术栈: Python + PyQt5</p>
+"""
+
+_USAGE_HTML = """<h3>模块说明</h3>
+
+<b>1. 进程管理</b>
+- 创建、删除进程
+- 观察进程状态转换（创建→就绪→运行→阻塞→终止）
+- 查看进程队列变化
+
+<b>2. 进程通信</b>
+- 生产者-消费者模型演示
+- 添加/移除生产者和消费者
+- 调整生产/消费速率
+- 观察共享缓冲区变化
+
+<b>3. 进程同步</b>
+- 哲学家就餐问题演示
+- P/V操作可视化
+- 信号量状态监控
+- 死锁预防机制
+
+<b>4. CPU调度</b>
+- FCFS、RR、SJF、优先级调度
+- 甘特图动态展示
+- 性能指标计算
+
+<b>5. 内存管理（扩展）</b>
+- 动态内存分配（首次/最佳/最坏适应）
+- 页面置换算法（FIFO/LRU/OPT/CLOCK）
+- 内存碎片可视化
+
+<b>6. 任务管理器（扩展）</b>
+- 实时系统监控
+- CPU/内存使用率图表
+- 进程列表与排序
+"""
+
 
 class MainWindow(QMainWindow):
     """主窗口"""
@@ -22,6 +73,8 @@ class MainWindow(QMainWindow):
         # 模块实例（延迟加载）
         self._modules = {}
         self._module_loaded = [False] * 6
+        # 任务管理器及其刷新定时器（加载后缓存，避免每次切换标签时查找）
+        self._task_manager = None
 
         self._init_ui()
         self._init_menu()
@@ -111,6 +164,7 @@ class MainWindow(QMainWindow):
             from ui.task_manager_module import TaskManagerModule
             module = TaskManagerModule()
             self._modules['task_manager'] = module
+            self._task_manager = module
 
         if module:
             # 替换占位符
@@ -130,18 +184,16 @@ class MainWindow(QMainWindow):
         if not self._module_loaded[index]:
             self._load_module(index)
 
-        # 暂停任务管理器定时器（当不在该标签页时）
-        if 'task_manager' in self._modules:
-            task_manager = self._modules['task_manager']
-            if index == 5:
-                # 切换到任务管理器，启动刷新
-                if hasattr(task_manager, 'refresh_timer') and not task_manager.refresh_timer.isActive():
-                    task_manager.refresh_timer.start(task_manager.refresh_interval)
-                    task_manager._refresh_all()
-            else:
-                # 离开任务管理器，暂停刷新
-                if hasattr(task_manager, 'refresh_timer'):
-                    task_manager.refresh_timer.stop()
+        # 暂停任务管理器刷新（当不在该标签页时）
+        task_manager = self._task_manager
+        if task_manager is None:
+            return
+        if index == 5:
+            # 切换到任务管理器，启动刷新
+            task_manager._start_refresh()
+        else:
+            # 离开任务管理器，暂停刷新
+            task_manager._stop_refresh()
 
     def _init_menu(self):
         """初始化菜单栏"""
@@ -158,29 +210,14 @@ class MainWindow(QMainWindow):
         # 视图菜单
         view_menu = menubar.addMenu("视图(&V)")
 
-        process_action = QAction("进程管理", self)
-        process_action.triggered.connect(lambda: self.tabs.setCurrentIndex(0))
-        view_menu.addAction(process_action)
-
-        ipc_action = QAction("进程通信", self)
-        ipc_action.triggered.connect(lambda: self.tabs.setCurrentIndex(1))
-        view_menu.addAction(ipc_action)
-
-        sync_action = QAction("进程同步", self)
-        sync_action.triggered.connect(lambda: self.tabs.setCurrentIndex(2))
-        view_menu.addAction(sync_action)
-
-        scheduler_action = QAction("CPU调度", self)
-        scheduler_action.triggered.connect(lambda: self.tabs.setCurrentIndex(3))
-        view_menu.addAction(scheduler_action)
-
-        memory_action = QAction("内存管理", self)
-        memory_action.triggered.connect(lambda: self.tabs.setCurrentIndex(4))
-        view_menu.addAction(memory_action)
-
-        taskman_action = QAction("任务管理器", self)
-        taskman_action.triggered.connect(lambda: self.tabs.setCurrentIndex(5))
-        view_menu.addAction(taskman_action)
+        view_items = [
+            ("进程管理", 0), ("进程通信", 1), ("进程同步", 2),
+            ("CPU调度", 3), ("内存管理", 4), ("任务管理器", 5)
+        ]
+        for text, index in view_items:
+            action = QAction(text, self)
+            action.triggered.connect(partial(self.tabs.setCurrentIndex, index))
+            view_menu.addAction(action)
 
         # 帮助菜单
         help_menu = menubar.addMenu("帮助(&H)")
@@ -207,64 +244,11 @@ class MainWindow(QMainWindow):
 
     def _show_about(self):
         """显示关于对话框"""
-        QMessageBox.about(
-            self,
-            "关于",
-            """<h2>操作系统原理可视化实验展示平台</h2>
-            <p>版本: 2.2.0</p>
-            <p>本平台用于展示操作系统核心原理：</p>
-            <ul>
-                <li>进程与线程的创建与管理</li>
-                <li>进程间通信（IPC）机制</li>
-                <li>基于信号量的进程同步</li>
-                <li>CPU调度算法</li>
-                <li>动态内存分配与页面置换</li>
-                <li>系统任务管理器</li>
-            </ul>
-            <p>技术栈: Python + PyQt5</p>
-            """
-        )
+        QMessageBox.about(self, "关于", _ABOUT_HTML)
 
     def _show_usage(self):
         """显示使用说明"""
-        QMessageBox.information(
-            self,
-            "使用说明",
-            """<h3>模块说明</h3>
-
-<b>1. 进程管理</b>
-- 创建、删除进程
-- 观察进程状态转换（创建→就绪→运行→阻塞→终止）
-- 查看进程队列变化
-
-<b>2. 进程通信</b>
-- 生产者-消费者模型演示
-- 添加/移除生产者和消费者
-- 调整生产/消费速率
-- 观察共享缓冲区变化
-
-<b>3. 进程同步</b>
-- 哲学家就餐问题演示
-- P/V操作可视化
-- 信号量状态监控
-- 死锁预防机制
-
-<b>4. CPU调度</b>
-- FCFS、RR、SJF、优先级调度
-- 甘特图动态展示
-- 性能指标计算
-
-<b>5. 内存管理（扩展）</b>
-- 动态内存分配（首次/最佳/最坏适应）
-- 页面置换算法（FIFO/LRU/OPT/CLOCK）
-- 内存碎片可视化
-
-<b>6. 任务管理器（扩展）</b>
-- 实时系统监控
-- CPU/内存使用率图表
-- 进程列表与排序
-"""
-        )
+        QMessageBox.information(self, "使用说明", _USAGE_HTML)
 
     def closeEvent(self, event):
         """关闭事件"""
@@ -7,8 +7,8 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                              QTableWidget, QTableWidgetItem, QHeaderView,
                              QMessageBox, QScrollArea, QSplitter, QTabWidget,
                              QTextEdit, QLineEdit)
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QColor
+from PyQt5.QtCore import Qt, QTimer, QSignalBlocker
+from PyQt5.QtGui import QColor, QBrush
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -22,6 +22,17 @@ from visualization.memory_view import (MemoryBlockWidget, PageFrameWidget,
 class MemoryModule(QWidget):
     """内存管理模块"""
 
+    # 分配表行背景
+    FREE_BRUSH = QBrush(QColor("#E8E8E8"))
+    ALLOCATED_BRUSH = QBrush(QColor("#C8E6C9"))
+    # 与分配算法下拉框顺序一致
+    ALLOC_ALGORITHMS = (
+        AllocationAlgorithm.FIRST_FIT,
+        AllocationAlgorithm.BEST_FIT,
+        AllocationAlgorithm.WORST_FIT,
+        AllocationAlgorithm.NEXT_FIT
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._init_ui()
@@ -29,13 +40,39 @@ class MemoryModule(QWidget):
     def _init_ui(self):
         layout = QVBoxLayout(self)
 
-        # 使用标签页分隔两个功能
+        # 使用标签页分隔两个功能（延迟加载，首次切换到该页时才创建）
         self.tabs = QTabWidget()
-        self.tabs.addTab(self._create_allocation_tab(), "动态内存分配")
-        self.tabs.addTab(self._create_page_replacement_tab(), "页面置换算法")
+        self._tab_factories = [
+            (self._create_allocation_tab, "动态内存分配"),
+            (self._create_page_replacement_tab, "页面置换算法"),
+        ]
+        self._tab_loaded = [False] * len(self._tab_factories)
+        for _, name in self._tab_factories:
+            self.tabs.addTab(QWidget(), name)
+        self.tabs.currentChanged.connect(self._load_tab)
 
         layout.addWidget(self.tabs)
 
+        self._load_tab(self.tabs.currentIndex())
+
+    def _load_tab(self, index: int):
+        """延迟创建标签页内容"""
+        if index < 0 or self._tab_loaded[index]:
+            return
+
+        self._tab_loaded[index] = True
+        factory, name = self._tab_factories[index]
+        widget = factory()
+
+        # 替换占位符（屏蔽信号，避免移除当前页时触发其他页加载）
+        placeholder = self.tabs.widget(index)
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, widget, name)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+
     def _create_allocation_tab(self) -> QWidget:
         """创建动态内存分配标签页"""
         widget = QWidget()
@@ -157,6 +194,8 @@ class MemoryModule(QWidget):
         self.alloc_table.setHorizontalHeaderLabels(["起始地址", "大小(KB)", "状态", "进程"])
         self.alloc_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         table_layout.addWidget(self.alloc_table)
+        # 表格项复用池，每行4个单元格
+        self._alloc_items = []
 
         bottom_layout.addWidget(table_widget, stretch=2)
 
@@ -333,6 +372,12 @@ class MemoryModule(QWidget):
 
         layout.addWidget(stats_group)
 
+        # 页框数变化防抖（连续调整时只在停止后重建一次）
+        self._last_frame_count = self.frame_count_spin.value()
+        self._frame_timer = QTimer()
+        self._frame_timer.setSingleShot(True)
+        self._frame_timer.timeout.connect(self._apply_frame_count)
+
         # 动画相关
         self.animation_timer = QTimer()
         self.animation_timer.timeout.connect(self._animation_step)
@@ -359,13 +404,7 @@ class MemoryModule(QWidget):
         size = self.alloc_size_spin.value()
         algo_index = self.alloc_algo_combo.currentIndex()
 
-        algorithms = [
-            AllocationAlgorithm.FIRST_FIT,
-            AllocationAlgorithm.BEST_FIT,
-            AllocationAlgorithm.WORST_FIT,
-            AllocationAlgorithm.NEXT_FIT
-        ]
-        algorithm = algorithms[algo_index]
+        algorithm = self.ALLOC_ALGORITHMS[algo_index]
 
         request = MemoryRequest(process_name, size)
         success = self.allocator.allocate(request, algorithm)
@@ -378,7 +417,9 @@ class MemoryModule(QWidget):
             try:
                 prefix = ''.join(filter(str.isalpha, process_name))
                 num = int(''.join(filter(str.isdigit, process_name))) + 1
-                self.process_name_input.setCurrentText(f"{prefix}{num}")
+                # 程序化赋值，屏蔽信号避免触发输入处理器
+                with QSignalBlocker(self.process_name_input):
+                    self.process_name_input.setCurrentText(f"{prefix}{num}")
             except:
                 pass
         else:
@@ -432,13 +473,7 @@ class MemoryModule(QWidget):
         ]
 
         algo_index = self.alloc_algo_combo.currentIndex()
-        algorithms = [
-            AllocationAlgorithm.FIRST_FIT,
-            AllocationAlgorithm.BEST_FIT,
-            AllocationAlgorithm.WORST_FIT,
-            AllocationAlgorithm.NEXT_FIT
-        ]
-        algorithm = algorithms[algo_index]
+        algorithm = self.ALLOC_ALGORITHMS[algo_index]
 
         for op, name, size in operations:
             if op == "allocate":
@@ -457,21 +492,22 @@ class MemoryModule(QWidget):
         # 更新内存块可视化
         self.memory_view.set_data(self.allocator.blocks, self.allocator.total_size)
 
-        # 更新表格
-        self.alloc_table.setRowCount(len(self.allocator.blocks))
-        for row, block in enumerate(self.allocator.blocks):
-            self.alloc_table.setItem(row, 0, QTableWidgetItem(str(block.start)))
-            self.alloc_table.setItem(row, 1, QTableWidgetItem(str(block.size)))
-            status = "空闲" if block.is_free else "已分配"
-            self.alloc_table.setItem(row, 2, QTableWidgetItem(status))
-            self.alloc_table.setItem(row, 3, QTableWidgetItem(block.process_name))
-
-            # 设置行背景色
-            color = QColor("#E8E8E8") if block.is_free else QColor("#C8E6C9")
-            for col in range(4):
-                item = self.alloc_table.item(row, col)
-                if item:
-                    item.setBackground(color)
+        # 更新表格（复用已有表格项，只修改文本和背景）
+        blocks = self.allocator.blocks
+        self.alloc_table.setUpdatesEnabled(False)
+        try:
+            self._resize_alloc_items(len(blocks))
+            for items, block in zip(self._alloc_items, blocks):
+                status = "空闲" if block.is_free else "已分配"
+                brush = self.FREE_BRUSH if block.is_free else self.ALLOCATED_BRUSH
+                items[0].setText(str(block.start))
+                items[1].setText(str(block.size))
+                items[2].setText(status)
+                items[3].setText(block.process_name)
+                for item in items:
+                    item.setBackground(brush)
+        finally:
+            self.alloc_table.setUpdatesEnabled(True)
 
         # 更新统计
         usage = self.allocator.get_usage()
@@ -481,15 +517,45 @@ class MemoryModule(QWidget):
         self.frag_label.setText(f"外部碎片: {frag}KB")
         self.frag_count_label.setText(f"空闲块数: {frag_count}")
 
+    def _resize_alloc_items(self, row_count: int):
+        """调整分配表行数，按需创建新行的表格项"""
+        if row_count < len(self._alloc_items):
+            # setRowCount 会删除多余行的表格项
+            del self._alloc_items[row_count:]
+        self.alloc_table.setRowCount(row_count)
+
+        for row in range(len(self._alloc_items), row_count):
+            items = [QTableWidgetItem() for _ in range(4)]
+            for col, item in enumerate(items):
+                self.alloc_table.setItem(row, col, item)
+            self._alloc_items.append(items)
+
     # ========== 页面置换相关方法 ==========
 
     def _on_frame_count_changed(self, value: int):
         """页框数变化"""
+        self._frame_timer.start(100)
+
+    def _apply_frame_count(self):
+        """应用页框数变化"""
+        value = self.frame_count_spin.value()
+        if value == self._last_frame_count:
+            return
+        self._last_frame_count = value
         self.page_replacer = PageReplacer(value)
         self._refresh_page_view()
 
+    def _sync_frame_count(self) -> int:
+        """取消待处理的页框数变化，返回当前页框数"""
+        self._frame_timer.stop()
+        self._last_frame_count = self.frame_count_spin.value()
+        return self._last_frame_count
+
     def _run_page_replacement(self):
         """执行页面置换"""
+        # 正在进行的动画会继续向历史视图追加列，先停止
+        self._stop_animation()
+
         # 解析页面序列
         try:
             seq_text = self.page_seq_input.text().strip()
@@ -513,7 +579,7 @@ class MemoryModule(QWidget):
         algorithm = algorithms[algo_index]
 
         # 执行
-        self.page_replacer = PageReplacer(self.frame_count_spin.value())
+        self.page_replacer = PageReplacer(self._sync_frame_count())
         steps = self.page_replacer.run_sequence(page_sequence, algorithm)
 
         # 显示结果
@@ -548,9 +614,10 @@ class MemoryModule(QWidget):
         algorithm = algorithms[algo_index]
 
         # 准备动画
-        self.page_replacer = PageReplacer(self.frame_count_spin.value())
+        self.page_replacer = PageReplacer(self._sync_frame_count())
         self.animation_steps = self.page_replacer.run_sequence(page_sequence, algorithm)
         self.current_animation_step = 0
+        self.page_history_view.set_data([])
 
         # 禁用按钮
         self.animate_btn.setEnabled(False)
@@ -562,13 +629,21 @@ class MemoryModule(QWidget):
     def _animation_step(self):
         """动画步骤"""
         if self.current_animation_step >= len(self.animation_steps):
-            self.animation_timer.stop()
-            self.animate_btn.setEnabled(True)
-            self.animate_btn.setText("动画演示")
+            self._stop_animation()
             return
 
         step = self.animation_steps[self.current_animation_step]
+        self._render_step(step)
+        self.current_animation_step += 1
+
+    def _stop_animation(self):
+        """停止动画并恢复按钮"""
+        self.animation_timer.stop()
+        self.animate_btn.setEnabled(True)
+        self.animate_btn.setText("动画演示")
 
+    def _render_step(self, step: dict):
+        """绘制单个动画步骤"""
         # 更新页框视图
         clock_pointer = -1
         ref_bits = {}
@@ -585,11 +660,8 @@ class MemoryModule(QWidget):
             ref_bits
         )
 
-        # 更新历史视图
-        self.page_history_view.set_data(
-            self.animation_steps[:self.current_animation_step + 1],
-            self.current_animation_step
-        )
+        # 更新历史视图（只追加新的一列）
+        self.page_history_view.append_step(step, self.current_animation_step)
 
         # 更新统计
         self.page_fault_label.setText(f"缺页次数: {step['page_faults']}")
@@ -602,16 +674,12 @@ class MemoryModule(QWidget):
             self.hit_rate_label.setText(f"命中率: {hit_rate:.1f}%")
             self.fault_rate_label.setText(f"缺页率: {fault_rate:.1f}%")
 
-        self.current_animation_step += 1
-
     def _reset_page_replacement(self):
         """重置页面置换"""
-        self.animation_timer.stop()
-        self.page_replacer = PageReplacer(self.frame_count_spin.value())
+        self._stop_animation()
+        self.page_replacer = PageReplacer(self._sync_frame_count())
         self.page_frame_view.set_data([])
         self.page_history_view.set_data([])
-        self.animate_btn.setEnabled(True)
-        self.animate_btn.setText("动画演示")
 
         self.page_fault_label.setText("缺页次数: 0")
         self.page_hit_label.setText("命中次数: 0")
@@ -2,14 +2,15 @@
 模块1：进程与线程的创建与管理界面
 """
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-                             QTableWidget, QTableWidgetItem, QGroupBox, QLabel,
+                             QTableView, QGroupBox, QLabel,
                              QLineEdit, QMessageBox, QHeaderView,
-                             QSplitter, QComboBox, QTabWidget, QTextEdit)
-from PyQt5.QtCore import Qt, QTimer, QDateTime
-from PyQt5.QtGui import QColor
+                             QSplitter, QComboBox, QTabWidget, QPlainTextEdit)
+from PyQt5.QtCore import Qt, QTimer, QDateTime, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QColor, QBrush
 import sys
 import os
 import random
+from contextlib import contextmanager
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.process import Process, ProcessState, ProcessManager, Thread, ThreadState
@@ -17,6 +18,141 @@ from visualization.state_machine import StateMachineWidget
 from visualization.queue_animation import QueueAnimationWidget
 
 
+class _ListTableModel(QAbstractTableModel):
+    """以列表快照为数据源的只读表格模型（按键增量更新）
+
+    子类提供 _key(obj) 行唯一键、_snapshot(obj) 行显示内容快照，
+    以及 _cell(snapshot, column, role) 单元格数据。
+    """
+
+    HEADERS = []
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._keys = []
+        self._snapshots = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        return self._cell(self._snapshots[index.row()], index.column(), role)
+
+    def set_rows(self, rows: list):
+        """与上次快照比较，只通知增删的行和内容变化的行"""
+        new_keys = [self._key(obj) for obj in rows]
+        new_key_set = set(new_keys)
+
+        # 删除已消失的行（从后往前，连续行合并为一次通知）
+        row = len(self._keys) - 1
+        while row >= 0:
+            if self._keys[row] in new_key_set:
+                row -= 1
+                continue
+            last = row
+            while row >= 0 and self._keys[row] not in new_key_set:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row + 1, last)
+            del self._rows[row + 1:last + 1]
+            del self._keys[row + 1:last + 1]
+            del self._snapshots[row + 1:last + 1]
+            self.endRemoveRows()
+
+        count = len(self._keys)
+        if self._keys != new_keys[:count]:
+            # 顺序发生变化，整体重置
+            self.beginResetModel()
+            self._rows = list(rows)
+            self._keys = new_keys
+            self._snapshots = [self._snapshot(obj) for obj in rows]
+            self.endResetModel()
+            return
+
+        # 内容变化的已有行
+        last_column = len(self.HEADERS) - 1
+        for row in range(count):
+            obj = rows[row]
+            snapshot = self._snapshot(obj)
+            self._rows[row] = obj
+            if snapshot != self._snapshots[row]:
+                self._snapshots[row] = snapshot
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+
+        # 追加新行
+        if len(rows) > count:
+            self.beginInsertRows(QModelIndex(), count, len(rows) - 1)
+            self._rows.extend(rows[count:])
+            self._keys.extend(new_keys[count:])
+            self._snapshots.extend(self._snapshot(obj) for obj in rows[count:])
+            self.endInsertRows()
+
+    def row_at(self, row: int):
+        """获取指定行对应的对象"""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+
+class ProcessTableModel(_ListTableModel):
+    """进程表格模型"""
+
+    HEADERS = ["PID", "名称", "状态"]
+    STATE_FOREGROUND = QBrush(QColor(255, 255, 255))
+
+    def __init__(self, state_colors: dict, parent=None):
+        super().__init__(parent)
+        # 预先构造各状态单元格的文本与画刷（按角色索引），data() 中直接查表
+        self._state_cells = {}
+        for state in ProcessState:
+            cell = {Qt.DisplayRole: state.value}
+            color = state_colors.get(state)
+            if color:
+                cell[Qt.BackgroundRole] = QBrush(color)
+                cell[Qt.ForegroundRole] = self.STATE_FOREGROUND
+            self._state_cells[state] = cell
+
+    def _key(self, process: Process):
+        return process.pid
+
+    def _snapshot(self, process: Process) -> tuple:
+        return (str(process.pid), process.name, process.state)
+
+    def _cell(self, snapshot: tuple, column: int, role: int):
+        if column == 2:
+            return self._state_cells[snapshot[2]].get(role)
+        if role == Qt.DisplayRole:
+            return snapshot[column]
+        return None
+
+
+class ThreadTableModel(_ListTableModel):
+    """线程表格模型"""
+
+    HEADERS = ["TID", "所属PID", "名称"]
+
+    def _key(self, thread: Thread):
+        return thread.tid
+
+    def _snapshot(self, thread: Thread) -> tuple:
+        return (str(thread.tid), str(thread.pid), thread.name)
+
+    def _cell(self, snapshot: tuple, column: int, role: int):
+        if role == Qt.DisplayRole:
+            return snapshot[column]
+        return None
+
+
 class ProcessModule(QWidget):
     """进程与线程管理模块"""
 
@@ -28,15 +164,35 @@ class ProcessModule(QWidget):
         ProcessState.TERMINATED: QColor(180, 100, 100),
     }
 
+    # 操作日志最大行数
+    LOG_MAX_LINES = 500
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.process_manager = ProcessManager()
         self.process_manager.add_state_change_callback(self._on_state_change)
         self.process_manager.add_thread_state_change_callback(self._on_thread_state_change)
         self._init_ui()
-        self._update_timer = QTimer()
-        self._update_timer.timeout.connect(self._refresh_display)
-        self._update_timer.start(500)
+        # 批量修改嵌套深度及期间最后一次进程状态转换
+        self._batch_depth = 0
+        self._batch_transition = None
+        # 上次刷新时的数据版本号与队列组成
+        self._last_version = -1
+        self._last_queue_key = None
+        # 合并同一轮事件循环内的多次刷新请求
+        self._refresh_timer = QTimer()
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self._refresh_display)
+        # 日志缓冲，短时间内的多条日志合并为一次写入
+        self._log_buffer = []
+        self._log_timer = QTimer()
+        self._log_timer.setSingleShot(True)
+        self._log_timer.timeout.connect(self._flush_log)
+
+    def showEvent(self, event):
+        """显示时补上隐藏期间的变化"""
+        super().showEvent(event)
+        self._schedule_refresh()
 
     def _init_ui(self):
         layout = QHBoxLayout(self)
@@ -65,13 +221,22 @@ class ProcessModule(QWidget):
         process_layout.addLayout(create_process_layout)
 
         # 进程列表
-        self.process_table = QTableWidget()
-        self.process_table.setColumnCount(3)
-        self.process_table.setHorizontalHeaderLabels(["PID", "名称", "状态"])
-        self.process_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.process_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.process_table.setSelectionMode(QTableWidget.SingleSelection)
+        self._selected_pid = -1
+        self.process_model = ProcessTableModel(self.STATE_COLORS, self)
+        self.process_table = QTableView()
+        self.process_table.setModel(self.process_model)
+        # 固定列宽，仅最后一列拉伸，避免每次数据变化重新计算全部列宽
+        header = self.process_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setStretchLastSection(True)
+        header.resizeSection(0, 60)
+        header.resizeSection(1, 150)
+        self.process_table.setSelectionBehavior(QTableView.SelectRows)
+        self.process_table.setSelectionMode(QTableView.SingleSelection)
         self.process_table.setMaximumHeight(150)
+        self.process_table.selectionModel().selectionChanged.connect(
+            self._on_process_selection_changed)
+        self.process_model.modelReset.connect(self._on_process_selection_changed)
         process_layout.addWidget(self.process_table)
 
         # 进程状态转换控制
@@ -124,13 +289,21 @@ class ProcessModule(QWidget):
         thread_layout.addLayout(create_thread_layout)
 
         # 线程列表
-        self.thread_table = QTableWidget()
-        self.thread_table.setColumnCount(3)
-        self.thread_table.setHorizontalHeaderLabels(["TID", "所属PID", "名称"])
-        self.thread_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.thread_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.thread_table.setSelectionMode(QTableWidget.SingleSelection)
+        self._selected_tid = -1
+        self.thread_model = ThreadTableModel(self)
+        self.thread_table = QTableView()
+        self.thread_table.setModel(self.thread_model)
+        header = self.thread_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setStretchLastSection(True)
+        header.resizeSection(0, 60)
+        header.resizeSection(1, 80)
+        self.thread_table.setSelectionBehavior(QTableView.SelectRows)
+        self.thread_table.setSelectionMode(QTableView.SingleSelection)
         self.thread_table.setMaximumHeight(150)
+        self.thread_table.selectionModel().selectionChanged.connect(
+            self._on_thread_selection_changed)
+        self.thread_model.modelReset.connect(self._on_thread_selection_changed)
         thread_layout.addWidget(self.thread_table)
 
         # 线程删除按钮
@@ -182,13 +355,15 @@ class ProcessModule(QWidget):
         # 操作日志
         log_group = QGroupBox("操作日志")
         log_layout = QVBoxLayout(log_group)
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        # 只保留最近的日志行，避免文档无限增长
+        self.log_text.setMaximumBlockCount(self.LOG_MAX_LINES)
         self.log_text.setMaximumHeight(150)
         log_layout.addWidget(self.log_text)
 
         clear_log_btn = QPushButton("清空日志")
-        clear_log_btn.clicked.connect(lambda: self.log_text.clear())
+        clear_log_btn.clicked.connect(self._clear_log)
         log_layout.addWidget(clear_log_btn)
         right_layout.addWidget(log_group)
 
@@ -198,7 +373,7 @@ class ProcessModule(QWidget):
         """创建新进程"""
         name = self.process_name_input.text() or "Process"
         process = self.process_manager.create_process(name)
-        self._refresh_display()
+        self._schedule_refresh()
 
     def _create_thread(self):
         """在选中进程下创建新线程"""
@@ -218,44 +393,60 @@ class ProcessModule(QWidget):
         name = self.thread_name_input.text() or "Thread"
         thread = self.process_manager.create_thread(pid, name)
         if thread:
-            self._refresh_display()
+            self._schedule_refresh()
         else:
             QMessageBox.warning(self, "创建失败", "无法创建线程")
 
+    @contextmanager
+    def _batch_refresh(self):
+        """批量修改期间暂停界面刷新，结束时统一刷新一次"""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                if self._batch_transition:
+                    self._update_state_machine(*self._batch_transition)
+                    self._batch_transition = None
+                self._refresh_display()
+
     def _batch_create(self):
         """批量创建进程和线程"""
-        for i in range(3):
-            process = self.process_manager.create_process(f"P{i+1}")
-            # 进程需先转为就绪态，再转为运行态才能创建线程
-            self.process_manager.ready(process.pid)
-            self.process_manager.run(process.pid)
-            # 在每个进程下创建2个线程
-            for j in range(2):
-                self.process_manager.create_thread(process.pid, f"T{i+1}-{j+1}")
-            # 创建完线程后，随机进入就绪态或阻塞态
-            if random.choice([True, False]):
-                self.process_manager.block(process.pid)
-            else:
+        with self._batch_refresh():
+            for i in range(3):
+                process = self.process_manager.create_process(f"P{i+1}")
+                # 进程需先转为就绪态，再转为运行态才能创建线程
                 self.process_manager.ready(process.pid)
-        self._refresh_display()
+                self.process_manager.run(process.pid)
+                # 在每个进程下创建2个线程
+                for j in range(2):
+                    self.process_manager.create_thread(process.pid, f"T{i+1}-{j+1}")
+                # 创建完线程后，随机进入就绪态或阻塞态
+                if random.choice([True, False]):
+                    self.process_manager.block(process.pid)
+                else:
+                    self.process_manager.ready(process.pid)
+
+    def _on_process_selection_changed(self):
+        """进程表选中行变化时缓存选中的PID"""
+        rows = self.process_table.selectionModel().selectedRows()
+        process = self.process_model.row_at(rows[0].row()) if rows else None
+        self._selected_pid = process.pid if process else -1
+
+    def _on_thread_selection_changed(self):
+        """线程表选中行变化时缓存选中的TID"""
+        rows = self.thread_table.selectionModel().selectedRows()
+        thread = self.thread_model.row_at(rows[0].row()) if rows else None
+        self._selected_tid = thread.tid if thread else -1
 
     def _get_selected_pid(self) -> int:
         """获取选中的进程PID"""
-        selected = self.process_table.selectedItems()
-        if not selected:
-            return -1
-        row = selected[0].row()
-        pid_item = self.process_table.item(row, 0)
-        return int(pid_item.text()) if pid_item else -1
+        return self._selected_pid
 
     def _get_selected_tid(self) -> int:
         """获取选中的线程TID"""
-        selected = self.thread_table.selectedItems()
-        if not selected:
-            return -1
-        row = selected[0].row()
-        tid_item = self.thread_table.item(row, 0)
-        return int(tid_item.text()) if tid_item else -1
+        return self._selected_tid
 
     def _change_process_state(self, action: str):
         """改变进程状态"""
@@ -303,7 +494,7 @@ class ProcessModule(QWidget):
 
             self.process_manager.delete_process(pid)
             self._log(f"进程 {process_name}(PID={pid}) 被删除")
-        self._refresh_display()
+        self._schedule_refresh()
 
     def _delete_thread(self):
         """删除线程"""
@@ -316,22 +507,34 @@ class ProcessModule(QWidget):
         if thread:
             self._log(f"线程 {thread.name}(TID={tid}) 被删除")
         self.process_manager.delete_thread(tid)
-        self._refresh_display()
+        self._schedule_refresh()
 
     def _reset_all(self):
         """重置所有进程和线程"""
         self.process_manager.reset()
         self._log("系统重置，清空所有进程和线程")
-        self._refresh_display()
+        self._schedule_refresh()
 
     def _log(self, message: str):
         """添加日志"""
         time_str = QDateTime.currentDateTime().toString("hh:mm:ss")
-        self.log_text.append(f"[{time_str}] {message}")
-        # 滚动到底部
-        self.log_text.verticalScrollBar().setValue(
-            self.log_text.verticalScrollBar().maximum()
-        )
+        self._log_buffer.append(f"[{time_str}] {message}")
+        if not self._log_timer.isActive():
+            self._log_timer.start(50)
+
+    def _flush_log(self):
+        """将缓冲的日志一次性写入"""
+        if not self._log_buffer:
+            return
+        # appendPlainText 在视图位于底部时会自动跟随滚动
+        self.log_text.appendPlainText("\n".join(self._log_buffer))
+        self._log_buffer.clear()
+
+    def _clear_log(self):
+        """清空日志"""
+        self._log_timer.stop()
+        self._log_buffer.clear()
+        self.log_text.clear()
 
     def _on_state_change(self, process: Process, old_state: ProcessState,
                         new_state: ProcessState):
@@ -342,12 +545,17 @@ class ProcessModule(QWidget):
         else:
             self._log(f"进程 {process.name}(PID={process.pid}): {old_state.value} → {new_state.value}")
 
-        self._refresh_display()
+        # 批量修改期间只记录最后一次转换，结束时统一显示
+        if self._batch_depth:
+            self._batch_transition = (old_state, new_state)
+            return
 
-        # 更新状态机显示
-        self.state_machine.set_current_state(new_state.value)
+        self._schedule_refresh()
+        self._update_state_machine(old_state, new_state)
 
-        # 高亮状态转换
+    def _update_state_machine(self, old_state: ProcessState, new_state: ProcessState):
+        """更新状态机显示并高亮状态转换"""
+        self.state_machine.set_current_state(new_state.value)
         if old_state:
             self.state_machine.highlight_transition(old_state.value, new_state.value)
 
@@ -358,36 +566,44 @@ class ProcessModule(QWidget):
         if old_state is None:
             self._log(f"  └─ 线程 {thread.name}(TID={thread.tid}) 在进程 PID={thread.pid} 下创建")
 
-        self._refresh_display()
+        if not self._batch_depth:
+            self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        """请求刷新显示（延迟到事件循环空闲时执行一次）"""
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start(0)
 
     def _refresh_display(self):
         """刷新显示"""
-        # 更新进程表格
-        processes = self.process_manager.get_all_processes()
-        self.process_table.setRowCount(len(processes))
-
-        for row, process in enumerate(processes):
-            self.process_table.setItem(row, 0, QTableWidgetItem(str(process.pid)))
-            self.process_table.setItem(row, 1, QTableWidgetItem(process.name))
-
-            state_item = QTableWidgetItem(process.state.value)
-            color = self.STATE_COLORS.get(process.state)
-            if color:
-                state_item.setBackground(color)
-                state_item.setForeground(QColor(255, 255, 255))
-            self.process_table.setItem(row, 2, state_item)
-
-        # 更新线程表格
-        threads = self.process_manager.get_all_threads()
-        self.thread_table.setRowCount(len(threads))
-
-        for row, thread in enumerate(threads):
-            self.thread_table.setItem(row, 0, QTableWidgetItem(str(thread.tid)))
-            self.thread_table.setItem(row, 1, QTableWidgetItem(str(thread.pid)))
-            self.thread_table.setItem(row, 2, QTableWidgetItem(thread.name))
+        if not self.isVisible():
+            return
+        # 自上次刷新以来数据未变化则跳过
+        version = self.process_manager.version
+        if version == self._last_version:
+            return
+        self._last_version = version
+
+        # 更新进程/线程表格（暂停重绘，所有行更新完后统一绘制一次）
+        self.process_table.setUpdatesEnabled(False)
+        self.thread_table.setUpdatesEnabled(False)
+        try:
+            self.process_model.set_rows(self.process_manager.get_all_processes())
+            self.thread_model.set_rows(self.process_manager.get_all_threads())
+        finally:
+            self.process_table.setUpdatesEnabled(True)
+            self.thread_table.setUpdatesEnabled(True)
 
         # 更新队列显示
         running = self.process_manager.get_running_process()
         ready = self.process_manager.get_ready_queue()
         blocked = self.process_manager.get_blocked_queue()
-        self.queue_widget.update_queues(running, ready, blocked)
+        # 队列组成未变化时不重建队列组件
+        queue_key = (
+            (running.pid, running.name) if running else None,
+            tuple((p.pid, p.name) for p in ready),
+            tuple((p.pid, p.name) for p in blocked),
+        )
+        if queue_key != self._last_queue_key:
+            self._last_queue_key = queue_key
+            self.queue_widget.update_queues(running, ready, blocked)
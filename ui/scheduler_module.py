@@ -3,9 +3,9 @@
 """
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                              QGroupBox, QLabel, QComboBox, QSpinBox, QDoubleSpinBox,
-                             QTableWidget, QTableWidgetItem, QHeaderView,
+                             QTableView, QHeaderView,
                              QMessageBox, QScrollArea, QSplitter, QSlider)
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QTimer, QAbstractTableModel, QModelIndex
 from PyQt5.QtGui import QColor
 import sys
 import os
@@ -15,12 +15,82 @@ from core.scheduler import Scheduler, SchedulerAlgorithm, GanttBlock
 from visualization.gantt_chart import GanttChartWidget
 
 
+class SchedulerTableModel(QAbstractTableModel):
+    """调度进程表格模型（缓存各行显示文本，只通知变化的行）"""
+
+    HEADERS = [
+        "进程", "到达时间", "执行时间", "优先级",
+        "开始时间", "完成时间", "等待时间"
+    ]
+
+    def __init__(self, scheduler: Scheduler, parent=None):
+        super().__init__(parent)
+        self._scheduler = scheduler
+        self._cells = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._cells)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        return self._cells[index.row()][index.column()]
+
+    @staticmethod
+    def _format_row(process) -> tuple:
+        """生成一行的显示文本（%d 直接截断取整，等价于 str(int(x))）"""
+        row = (process.name, "%d" % process.arrival_time,
+               "%d" % process.burst_time, "%d" % process.priority)
+        # 结果列（如果已计算）
+        if process.start_time >= 0:
+            return row + ("%d" % process.start_time, "%d" % process.finish_time,
+                          "%d" % process.waiting_time)
+        return row + ("-", "-", "-")
+
+    def refresh(self):
+        """与调度器的进程列表同步，只通知文本变化或增删的行"""
+        new_cells = [self._format_row(p) for p in self._scheduler.processes]
+        old_count = len(self._cells)
+        new_count = len(new_cells)
+
+        if new_count < old_count:
+            self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
+            del self._cells[new_count:]
+            self.endRemoveRows()
+
+        last_column = len(self.HEADERS) - 1
+        for row in range(min(old_count, new_count)):
+            if new_cells[row] != self._cells[row]:
+                self._cells[row] = new_cells[row]
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+
+        if new_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+            self._cells.extend(new_cells[old_count:])
+            self.endInsertRows()
+
+
 class SchedulerModule(QWidget):
     """CPU调度模块"""
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.scheduler = Scheduler()
+        # 与算法下拉框顺序一致
+        self._algorithms = [
+            self.scheduler.fcfs,
+            lambda: self.scheduler.round_robin(self.timeslice_spin.value()),
+            self.scheduler.sjf,
+            self.scheduler.priority_scheduling,
+        ]
         self._init_ui()
         self._load_sample_data()
 
@@ -130,13 +200,14 @@ class SchedulerModule(QWidget):
         table_header.setStyleSheet("font-weight: bold; font-size: 12px;")
         table_layout.addWidget(table_header)
 
-        self.process_table = QTableWidget()
-        self.process_table.setColumnCount(7)
-        self.process_table.setHorizontalHeaderLabels([
-            "进程", "到达时间", "执行时间", "优先级",
-            "开始时间", "完成时间", "等待时间"
-        ])
-        self.process_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.process_model = SchedulerTableModel(self.scheduler, self)
+        self.process_table = QTableView()
+        self.process_table.setModel(self.process_model)
+        # 固定列宽，仅最后一列拉伸，避免每次数据变化重新计算全部列宽
+        header = self.process_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setDefaultSectionSize(140)
+        header.setStretchLastSection(True)
         table_layout.addWidget(self.process_table)
 
         # 删除进程按钮
@@ -239,7 +310,7 @@ class SchedulerModule(QWidget):
 
     def _delete_process(self):
         """删除选中的进程"""
-        selected = self.process_table.selectedItems()
+        selected = self.process_table.selectionModel().selectedIndexes()
         if not selected:
             return
 
@@ -250,23 +321,11 @@ class SchedulerModule(QWidget):
 
     def _refresh_table(self):
         """刷新进程表格"""
-        self.process_table.setRowCount(len(self.scheduler.processes))
-
-        for row, process in enumerate(self.scheduler.processes):
-            self.process_table.setItem(row, 0, QTableWidgetItem(process.name))
-            self.process_table.setItem(row, 1, QTableWidgetItem(str(int(process.arrival_time))))
-            self.process_table.setItem(row, 2, QTableWidgetItem(str(int(process.burst_time))))
-            self.process_table.setItem(row, 3, QTableWidgetItem(str(process.priority)))
-
-            # 结果列（如果已计算）
-            if process.start_time >= 0:
-                self.process_table.setItem(row, 4, QTableWidgetItem(str(int(process.start_time))))
-                self.process_table.setItem(row, 5, QTableWidgetItem(str(int(process.finish_time))))
-                self.process_table.setItem(row, 6, QTableWidgetItem(str(int(process.waiting_time))))
-            else:
-                self.process_table.setItem(row, 4, QTableWidgetItem("-"))
-                self.process_table.setItem(row, 5, QTableWidgetItem("-"))
-                self.process_table.setItem(row, 6, QTableWidgetItem("-"))
+        self.process_table.setUpdatesEnabled(False)
+        try:
+            self.process_model.refresh()
+        finally:
+            self.process_table.setUpdatesEnabled(True)
 
     def _run_scheduling(self):
         """执行调度算法"""
@@ -274,17 +333,7 @@ class SchedulerModule(QWidget):
             QMessageBox.warning(self, "提示", "请先添加进程")
             return
 
-        algo_index = self.algo_combo.currentIndex()
-
-        if algo_index == 0:  # FCFS
-            blocks, _ = self.scheduler.fcfs()
-        elif algo_index == 1:  # RR
-            time_slice = self.timeslice_spin.value()
-            blocks, _ = self.scheduler.round_robin(time_slice)
-        elif algo_index == 2:  # SJF
-            blocks, _ = self.scheduler.sjf()
-        elif algo_index == 3:  # Priority
-            blocks, _ = self.scheduler.priority_scheduling()
+        blocks, _ = self._algorithms[self.algo_combo.currentIndex()]()
 
         # 更新显示
         self.gantt_chart.set_data(blocks)
@@ -298,17 +347,7 @@ class SchedulerModule(QWidget):
             return
 
         # 先执行调度
-        algo_index = self.algo_combo.currentIndex()
-
-        if algo_index == 0:
-            blocks, _ = self.scheduler.fcfs()
-        elif algo_index == 1:
-            time_slice = self.timeslice_spin.value()
-            blocks, _ = self.scheduler.round_robin(time_slice)
-        elif algo_index == 2:
-            blocks, _ = self.scheduler.sjf()
-        elif algo_index == 3:
-            blocks, _ = self.scheduler.priority_scheduling()
+        blocks, _ = self._algorithms[self.algo_combo.currentIndex()]()
 
         # 启动动画
         self.gantt_chart.start_animation(blocks, speed=0.3)
@@ -4,29 +4,172 @@
 """
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                              QGroupBox, QLabel, QSlider, QCheckBox, QTextEdit,
-                             QTableWidget, QTableWidgetItem, QHeaderView,
+                             QTableView, QHeaderView,
                              QSpinBox, QSizePolicy, QScrollArea, QFrame)
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QObject
-from PyQt5.QtGui import QColor, QTextCursor
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from PyQt5.QtCore import (Qt, QTimer, pyqtSignal, QObject,
+                          QAbstractTableModel, QModelIndex)
+from PyQt5.QtGui import QColor, QBrush
+import threading
 
 from core.synchronization import DiningPhilosophers, PhilosopherState, SemaphoreLog
 from visualization.philosopher_table import PhilosopherTableWidget
 
+# 死锁预防策略 / 死锁原因说明
+_PREVENTION_TEXT = (
+    "【死锁预防策略】打破循环等待条件：\n"
+    "让最后一位哲学家(P4)先拿右边的叉子再拿左边的叉子，\n"
+    "而其他哲学家都是先拿左边再拿右边。\n"
+    "这样就打破了循环等待，避免了死锁的发生。"
+)
+
+_DEADLOCK_CAUSE_TEXT = (
+    "【死锁产生条件】当所有哲学家同时拿起左边的叉子时：\n"
+    "1. 互斥条件：每把叉子只能被一个哲学家持有\n"
+    "2. 持有并等待：每人持有左叉子，等待右叉子\n"
+    "3. 不可剥夺：已持有的叉子不能被强制拿走\n"
+    "4. 循环等待：P0等P1的叉子，P1等P2的...P4等P0的"
+)
+
+# 说明/警告标签样式
+_PREVENTION_CSS = """
+QLabel {
+    color: #155724;
+    background-color: #d4edda;
+    border: 1px solid #c3e6cb;
+    padding: 10px;
+    border-radius: 5px;
+}
+"""
+
+_DEADLOCK_CAUSE_CSS = """
+QLabel {
+    color: #856404;
+    background-color: #fff3cd;
+    border: 1px solid #ffeeba;
+    padding: 10px;
+    border-radius: 5px;
+}
+"""
+
+_DEADLOCK_WARNING_CSS = """
+QLabel {
+    color: white;
+    background-color: #e74c3c;
+    padding: 12px;
+    border-radius: 5px;
+    font-weight: bold;
+    font-size: 13px;
+}
+"""
+
+# P/V 操作日志的 HTML 模板，按 (操作, 结果) 索引
+_LOG_TEMPLATES = {
+    ("P", "success"): "<span style='color:#e74c3c'>[P] {0} -> {1} ({2}→{3}) [success]</span>",
+    ("P", "blocked"): "<span style='color:#f39c12'>[P] {0} -> {1} ({2}→{3}) [blocked]</span>",
+    ("V", "success"): "<span style='color:#27ae60'>[V] {0} -> {1} ({2}→{3}) [success]</span>",
+}
+
+
+def _render_log(log: SemaphoreLog) -> str:
+    """将一条 P/V 操作日志渲染为 HTML"""
+    template = _LOG_TEMPLATES.get((log.operation, log.result))
+    if template is None:
+        color = "#f39c12" if log.result == "blocked" else (
+            "#27ae60" if log.operation == "V" else "#e74c3c")
+        template = (f"<span style='color:{color}'>[{log.operation}] "
+                    f"{{0}} -> {{1}} ({{2}}→{{3}}) [{log.result}]</span>")
+    return template.format(log.process_name, log.semaphore_name,
+                           log.old_value, log.new_value)
+
 
 class SignalBridge(QObject):
     """信号桥接器"""
-    state_changed = pyqtSignal(int, object)
-    log_received = pyqtSignal(object)
-    fork_changed = pyqtSignal(list)
+    # 跨线程信号只传递基本类型
+    state_changed = pyqtSignal(int, str)
+    # 已渲染好的日志 HTML
+    log_received = pyqtSignal(str)
+    fork_changed = pyqtSignal()
     deadlock_detected = pyqtSignal()
 
 
+class ForkTableModel(QAbstractTableModel):
+    """叉子信号量状态表格模型（行数固定）"""
+
+    HEADERS = ["叉子", "值", "等待队列"]
+    # 信号量值背景：可用 / 刚好占用 / 有进程等待
+    BRUSH_FREE = QBrush(QColor(200, 255, 200))
+    BRUSH_TAKEN = QBrush(QColor(255, 255, 200))
+    BRUSH_WAITING = QBrush(QColor(255, 200, 200))
+
+    def __init__(self, fork_count: int, parent=None):
+        super().__init__(parent)
+        self._rows = [[f"F{i}", 1, "-"] for i in range(fork_count)]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            return str(row[1]) if column == 1 else row[column]
+        if role == Qt.BackgroundRole and column == 1:
+            value = row[1]
+            if value > 0:
+                return self.BRUSH_FREE
+            if value == 0:
+                return self.BRUSH_TAKEN
+            return self.BRUSH_WAITING
+        return None
+
+    def _emit_changed(self, first: int, last: int):
+        """通知指定行范围的值和等待队列两列变化"""
+        self.dataChanged.emit(self.index(first, 1), self.index(last, 2),
+                              [Qt.DisplayRole, Qt.BackgroundRole])
+
+    def _update_row(self, index: int, value: int, waiting: str) -> bool:
+        """更新一行，返回内容是否变化"""
+        row = self._rows[index]
+        if row[1] == value and row[2] == waiting:
+            return False
+        row[1] = value
+        row[2] = waiting
+        return True
+
+    def set_fork_states(self, fork_states: list):
+        """更新叉子状态，只通知内容变化的行"""
+        changed = []
+        for state in fork_states:
+            value = state.get("value", 1 if state["available"] else 0)
+            waiting = ", ".join(state["waiting"]) if state["waiting"] else "-"
+            if self._update_row(state["id"], value, waiting):
+                changed.append(state["id"])
+        if changed:
+            self._emit_changed(min(changed), max(changed))
+
+    def reset(self):
+        """恢复为初始状态（全部可用）"""
+        for index in range(len(self._rows)):
+            self._update_row(index, 1, "-")
+        self._emit_changed(0, len(self._rows) - 1)
+
+
 class SyncModule(QWidget):
     """进程同步模块"""
 
+    # 日志框最多保留的段落数（每次批量写入为一段），超出后自动丢弃最早的内容
+    LOG_MAX_BLOCKS = 2000
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.dining = DiningPhilosophers(5)
@@ -35,19 +178,36 @@ class SyncModule(QWidget):
         self.signal_bridge = SignalBridge()
         self.signal_bridge.state_changed.connect(self._on_state_changed)
         self.signal_bridge.log_received.connect(self._on_log)
-        self.signal_bridge.fork_changed.connect(self._on_fork_changed)
+        self.signal_bridge.fork_changed.connect(self._drain_forks)
+
+        # 工作线程只保留最新的叉子状态，GUI 线程取走前不重复投递信号
+        self._fork_lock = threading.Lock()
+        self._latest_forks = None
+        self._fork_post_pending = False
 
         # 设置回调
         self.dining.set_state_callback(self._state_callback)
         self.dining.set_log_callback(self._log_callback)
         self.dining.set_fork_state_callback(self._fork_callback)
 
-        # 死锁检测定时器
-        self.deadlock_timer = QTimer()
-        self.deadlock_timer.timeout.connect(self._check_deadlock)
+        # 死锁检测（每次叉子状态变化后进行）
         self.signal_bridge.deadlock_detected.connect(self._on_deadlock_detected)
         self._deadlock_warned = False
 
+        # 叉子状态合并：短时间内的多次变化只应用最后一次
+        self._pending_forks = None
+        self._prev_fork_sig = None
+        self._fork_flush = QTimer(self)
+        self._fork_flush.setSingleShot(True)
+        self._fork_flush.setInterval(33)
+        self._fork_flush.timeout.connect(self._apply_forks)
+
+        # 日志缓冲，定时合并写入日志框
+        self._log_buffer = []
+        self._log_flush_timer = QTimer()
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+
         self._init_ui()
 
     def _init_ui(self):
@@ -102,30 +262,10 @@ class SyncModule(QWidget):
         speed_layout.setSpacing(3)
         speed_layout.setContentsMargins(8, 12, 8, 8)
 
-        # 思考时间 - 水平布局
-        think_layout = QHBoxLayout()
-        think_layout.addWidget(QLabel("思考:"))
-        self.think_slider = QSlider(Qt.Horizontal)
-        self.think_slider.setRange(5, 50)
-        self.think_slider.setValue(20)
-        self.think_slider.valueChanged.connect(self._update_speed)
-        think_layout.addWidget(self.think_slider)
-        self.think_label = QLabel("2.0s")
-        self.think_label.setMinimumWidth(35)
-        think_layout.addWidget(self.think_label)
+        # 思考时间 / 进餐时间 - 水平布局
+        think_layout, self.think_slider, self.think_label = self._make_slider_row("思考:", 20)
         speed_layout.addLayout(think_layout)
-
-        # 进餐时间 - 水平布局
-        eat_layout = QHBoxLayout()
-        eat_layout.addWidget(QLabel("进餐:"))
-        self.eat_slider = QSlider(Qt.Horizontal)
-        self.eat_slider.setRange(5, 50)
-        self.eat_slider.setValue(20)
-        self.eat_slider.valueChanged.connect(self._update_speed)
-        eat_layout.addWidget(self.eat_slider)
-        self.eat_label = QLabel("2.0s")
-        self.eat_label.setMinimumWidth(35)
-        eat_layout.addWidget(self.eat_label)
+        eat_layout, self.eat_slider, self.eat_label = self._make_slider_row("进餐:", 20)
         speed_layout.addLayout(eat_layout)
 
         left_layout.addWidget(speed_group)
@@ -137,12 +277,11 @@ class SyncModule(QWidget):
         sem_layout.setContentsMargins(5, 10, 5, 5)
         sem_layout.setSpacing(0)
 
-        self.sem_table = QTableWidget()
-        self.sem_table.setColumnCount(3)
-        self.sem_table.setHorizontalHeaderLabels(["叉子", "值", "等待队列"])
+        self.fork_model = ForkTableModel(self.dining.num_philosophers, self)
+        self.sem_table = QTableView()
+        self.sem_table.setModel(self.fork_model)
         self.sem_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.sem_table.verticalHeader().setVisible(False)
-        self.sem_table.setRowCount(5)
         # 禁用滚动条
         self.sem_table.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.sem_table.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
@@ -150,12 +289,6 @@ class SyncModule(QWidget):
         self.sem_table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.sem_table.setFixedHeight(230)
 
-        for i in range(5):
-            self.sem_table.setItem(i, 0, QTableWidgetItem(f"F{i}"))
-            self.sem_table.setItem(i, 1, QTableWidgetItem("1"))
-            self.sem_table.setItem(i, 2, QTableWidgetItem("-"))
-            self.sem_table.item(i, 1).setBackground(QColor(200, 255, 200))
-
         sem_layout.addWidget(self.sem_table)
         left_layout.addWidget(sem_group)
 
@@ -166,10 +299,11 @@ class SyncModule(QWidget):
 
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.document().setMaximumBlockCount(self.LOG_MAX_BLOCKS)
         log_layout.addWidget(self.log_text)
 
         clear_btn = QPushButton("清空日志")
-        clear_btn.clicked.connect(lambda: self.log_text.clear())
+        clear_btn.clicked.connect(self._clear_log)
         log_layout.addWidget(clear_btn)
 
         left_layout.addWidget(log_group, stretch=1)
@@ -187,41 +321,11 @@ class SyncModule(QWidget):
         self.table_widget = PhilosopherTableWidget(5)
         vis_layout.addWidget(self.table_widget, stretch=1)
 
-        # 图例说明 - 哲学家状态
-        legend_layout = QHBoxLayout()
-        legend_layout.setSpacing(12)
-        legend_items = [
-            ("思考", "#3498db"),
-            ("饥饿", "#f39c12"),
-            ("进餐", "#27ae60"),
-        ]
-        for text, color in legend_items:
-            item_layout = QHBoxLayout()
-            item_layout.setSpacing(3)
-            color_box = QLabel()
-            color_box.setFixedSize(14, 14)
-            color_box.setStyleSheet(f"background-color: {color}; border-radius: 3px;")
-            item_layout.addWidget(color_box)
-            item_layout.addWidget(QLabel(text))
-            legend_layout.addLayout(item_layout)
-
-        # 叉子状态图例
-        legend_layout.addSpacing(15)
-        fork_items = [
-            ("叉子可用", "#c0c0c0"),
-            ("叉子占用", "#dc5050"),
-        ]
-        for text, color in fork_items:
-            item_layout = QHBoxLayout()
-            item_layout.setSpacing(3)
-            color_box = QLabel()
-            color_box.setFixedSize(14, 14)
-            color_box.setStyleSheet(f"background-color: {color}; border-radius: 3px;")
-            item_layout.addWidget(color_box)
-            item_layout.addWidget(QLabel(text))
-            legend_layout.addLayout(item_layout)
-
-        legend_layout.addStretch()
+        # 图例说明 - 哲学家状态与叉子状态
+        legend_layout = self._make_legend(
+            [("思考", "#3498db"), ("饥饿", "#f39c12"), ("进餐", "#27ae60")],
+            [("叉子可用", "#c0c0c0"), ("叉子占用", "#dc5050")],
+        )
         vis_layout.addLayout(legend_layout)
 
         # 问题说明
@@ -241,133 +345,174 @@ class SyncModule(QWidget):
         param_label.setStyleSheet("color: #888; padding: 3px; font-size: 11px;")
         vis_layout.addWidget(param_label)
 
-        # 死锁预防说明（默认显示）
-        self.prevention_label = QLabel(
-            "【死锁预防策略】打破循环等待条件：\n"
-            "让最后一位哲学家(P4)先拿右边的叉子再拿左边的叉子，\n"
-            "而其他哲学家都是先拿左边再拿右边。\n"
-            "这样就打破了循环等待，避免了死锁的发生。"
-        )
-        self.prevention_label.setWordWrap(True)
-        self.prevention_label.setStyleSheet("""
-            QLabel {
-                color: #155724;
-                background-color: #d4edda;
-                border: 1px solid #c3e6cb;
-                padding: 10px;
-                border-radius: 5px;
-            }
-        """)
-        vis_layout.addWidget(self.prevention_label)
-
-        # 死锁原因说明（默认隐藏）
-        self.deadlock_cause_label = QLabel(
-            "【死锁产生条件】当所有哲学家同时拿起左边的叉子时：\n"
-            "1. 互斥条件：每把叉子只能被一个哲学家持有\n"
-            "2. 持有并等待：每人持有左叉子，等待右叉子\n"
-            "3. 不可剥夺：已持有的叉子不能被强制拿走\n"
-            "4. 循环等待：P0等P1的叉子，P1等P2的...P4等P0的"
-        )
-        self.deadlock_cause_label.setWordWrap(True)
-        self.deadlock_cause_label.setStyleSheet("""
-            QLabel {
-                color: #856404;
-                background-color: #fff3cd;
-                border: 1px solid #ffeeba;
-                padding: 10px;
-                border-radius: 5px;
-            }
-        """)
-        self.deadlock_cause_label.hide()
-        vis_layout.addWidget(self.deadlock_cause_label)
+        # 死锁预防策略 / 死锁原因说明（首次需要显示时才创建）
+        self.vis_layout = vis_layout
+        self.prevention_label = None
+        self.deadlock_cause_label = None
 
         # 死锁警告标签
         self.deadlock_label = QLabel("")
         self.deadlock_label.setWordWrap(True)
-        self.deadlock_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                background-color: #e74c3c;
-                padding: 12px;
-                border-radius: 5px;
-                font-weight: bold;
-                font-size: 13px;
-            }
-        """)
+        self.deadlock_label.setStyleSheet(_DEADLOCK_WARNING_CSS)
         self.deadlock_label.setAlignment(Qt.AlignCenter)
         self.deadlock_label.hide()
         vis_layout.addWidget(self.deadlock_label)
 
+        self._show_strategy_note(self.deadlock_check.isChecked())
+
         right_layout.addWidget(vis_group)
 
         layout.addWidget(right_panel, stretch=1)
 
+    def _make_slider_row(self, label: str, default: int):
+        """创建一行时间滑块，返回 (布局, 滑块, 数值标签)"""
+        row_layout = QHBoxLayout()
+        row_layout.addWidget(QLabel(label))
+        slider = QSlider(Qt.Horizontal)
+        slider.setRange(5, 50)
+        slider.setValue(default)
+        slider.valueChanged.connect(self._update_speed)
+        row_layout.addWidget(slider)
+        value_label = QLabel(f"{default / 10.0:.1f}s")
+        value_label.setMinimumWidth(35)
+        row_layout.addWidget(value_label)
+        return row_layout, slider, value_label
+
+    def _make_legend(self, *groups) -> QHBoxLayout:
+        """创建图例行，各组之间留出间隔"""
+        legend_layout = QHBoxLayout()
+        legend_layout.setSpacing(12)
+        for i, items in enumerate(groups):
+            if i:
+                legend_layout.addSpacing(15)
+            for text, color in items:
+                legend_layout.addWidget(self._make_legend_entry(text, color))
+        legend_layout.addStretch()
+        return legend_layout
+
+    @staticmethod
+    def _make_legend_entry(text: str, color: str) -> QLabel:
+        """创建图例项（色块与文字合并为一个标签）"""
+        return QLabel(f"<span style='background-color:{color};'>&nbsp;&nbsp;&nbsp;&nbsp;</span>"
+                      f"&nbsp;{text}")
+
     def _state_callback(self, philosopher_id: int, state: PhilosopherState):
         """哲学家状态变化回调（线程安全）"""
-        self.signal_bridge.state_changed.emit(philosopher_id, state)
+        self.signal_bridge.state_changed.emit(philosopher_id, state.value)
 
     def _log_callback(self, log: SemaphoreLog):
         """日志回调（线程安全）"""
-        self.signal_bridge.log_received.emit(log)
+        self.signal_bridge.log_received.emit(_render_log(log))
 
     def _fork_callback(self, fork_states: list):
         """叉子状态回调（线程安全）"""
-        self.signal_bridge.fork_changed.emit(fork_states)
-
-    def _on_state_changed(self, philosopher_id: int, state: PhilosopherState):
+        with self._fork_lock:
+            self._latest_forks = fork_states
+            if self._fork_post_pending:
+                return
+            self._fork_post_pending = True
+        self.signal_bridge.fork_changed.emit()
+
+    def _on_state_changed(self, philosopher_id: int, state_value: str):
         """处理状态变化"""
-        self.table_widget.set_philosopher_state(philosopher_id, state)
+        self.table_widget.set_philosopher_state(philosopher_id, PhilosopherState(state_value))
 
-    def _on_log(self, log: SemaphoreLog):
-        """处理日志"""
-        color = "#27ae60" if log.operation == "V" else "#e74c3c"
-        if log.result == "blocked":
-            color = "#f39c12"
+    def _on_log(self, html: str):
+        """处理日志（HTML 已在工作线程中生成）"""
+        self._append_log(html)
 
-        msg = (f"<span style='color:{color}'>"
-               f"[{log.operation}] {log.process_name} -> {log.semaphore_name} "
-               f"({log.old_value}→{log.new_value}) [{log.result}]"
-               f"</span>")
-        self.log_text.append(msg)
+    def _append_log(self, html: str):
+        """添加一条日志（缓冲后批量写入）"""
+        self._log_buffer.append(html)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start(50)
 
-        # 自动滚动
-        cursor = self.log_text.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        self.log_text.setTextCursor(cursor)
+    def _flush_log(self):
+        """将缓冲的日志一次性写入日志框"""
+        if not self._log_buffer:
+            return
+        # 仅当用户未向上翻看时才跟随到底部
+        scroll_bar = self.log_text.verticalScrollBar()
+        at_bottom = scroll_bar.value() >= scroll_bar.maximum() - 4
+        self.log_text.append("<br>".join(self._log_buffer))
+        self._log_buffer.clear()
+        if at_bottom:
+            scroll_bar.setValue(scroll_bar.maximum())
+
+    def _clear_log(self):
+        """清空日志"""
+        self._log_flush_timer.stop()
+        self._log_buffer.clear()
+        self.log_text.clear()
+
+    def _drain_forks(self):
+        """取出工作线程投递的最新叉子状态"""
+        with self._fork_lock:
+            fork_states = self._latest_forks
+            self._latest_forks = None
+            self._fork_post_pending = False
+        if fork_states is not None:
+            self._on_fork_changed(fork_states)
 
     def _on_fork_changed(self, fork_states: list):
-        """处理叉子状态变化"""
-        self.table_widget.set_fork_states(fork_states)
+        """处理叉子状态变化（合并后延迟应用）"""
+        self._pending_forks = fork_states
+        if not self._fork_flush.isActive():
+            self._fork_flush.start()
+
+    def _apply_forks(self):
+        """应用最近一次叉子状态"""
+        fork_states = self._pending_forks
+        if fork_states is None:
+            return
+        self._pending_forks = None
 
-        # 更新信号量表
-        for state in fork_states:
-            row = state["id"]
-            value = state.get("value", 1 if state["available"] else 0)
-            waiting = ", ".join(state["waiting"]) if state["waiting"] else "-"
+        # 可见状态（值与等待队列）未变化时不重绘
+        sig = tuple((state["id"], state.get("value"), tuple(state["waiting"]))
+                    for state in fork_states)
+        if sig != self._prev_fork_sig:
+            self._prev_fork_sig = sig
+            self.table_widget.set_fork_states(fork_states)
 
-            self.sem_table.setItem(row, 1, QTableWidgetItem(str(value)))
-            self.sem_table.setItem(row, 2, QTableWidgetItem(waiting))
+            # 更新信号量表
+            self.fork_model.set_fork_states(fork_states)
 
-            # 设置颜色
-            value_item = self.sem_table.item(row, 1)
-            if value > 0:
-                value_item.setBackground(QColor(200, 255, 200))
-            elif value == 0:
-                value_item.setBackground(QColor(255, 255, 200))
-            else:
-                value_item.setBackground(QColor(255, 200, 200))
+        # 叉子状态变化后检测死锁
+        self._check_deadlock()
+
+    def _check_deadlock(self):
+        """检测死锁（已提示过则跳过）"""
+        if not self._deadlock_warned and self.dining.check_deadlock():
+            self.signal_bridge.deadlock_detected.emit()
 
     def _on_deadlock_option_changed(self, state: int):
         """死锁预防选项变化"""
         self.dining.set_deadlock_prevention(state == Qt.Checked)
-        if state == Qt.Checked:
-            # 启用死锁预防：显示预防策略，隐藏死锁原因
+        self._show_strategy_note(state == Qt.Checked)
+
+    def _show_strategy_note(self, prevention: bool):
+        """启用死锁预防时显示预防策略，否则显示死锁原因"""
+        if prevention:
+            if self.prevention_label is None:
+                self.prevention_label = self._add_note_label(_PREVENTION_TEXT, _PREVENTION_CSS)
             self.prevention_label.show()
-            self.deadlock_cause_label.hide()
+            if self.deadlock_cause_label is not None:
+                self.deadlock_cause_label.hide()
         else:
-            # 关闭死锁预防：隐藏预防策略，显示死锁原因
-            self.prevention_label.hide()
+            if self.deadlock_cause_label is None:
+                self.deadlock_cause_label = self._add_note_label(_DEADLOCK_CAUSE_TEXT,
+                                                                 _DEADLOCK_CAUSE_CSS)
             self.deadlock_cause_label.show()
+            if self.prevention_label is not None:
+                self.prevention_label.hide()
+
+    def _add_note_label(self, text: str, css: str) -> QLabel:
+        """创建说明标签，插入到死锁警告标签之前"""
+        label = QLabel(text)
+        label.setWordWrap(True)
+        label.setStyleSheet(css)
+        self.vis_layout.insertWidget(self.vis_layout.indexOf(self.deadlock_label), label)
+        return label
 
     def _update_speed(self):
         """更新速度"""
@@ -386,28 +531,32 @@ class SyncModule(QWidget):
         self.pause_btn.setEnabled(True)
         self.stop_btn.setEnabled(True)
         self.deadlock_check.setEnabled(False)
-        self.table_widget.start_animation()
-        self.log_text.append("<b>--- 模拟开始 ---</b>")
+        self._append_log("<b>--- 模拟开始 ---</b>")
         self._deadlock_warned = False
         self.deadlock_label.hide()
-        self.deadlock_timer.start(500)
 
     def _pause(self):
         """暂停/恢复"""
         if self.pause_btn.text() == "暂停":
             self.dining.pause()
             self.pause_btn.setText("继续")
-            self.log_text.append("<i>--- 模拟暂停 ---</i>")
+            self._append_log("<i>--- 模拟暂停 ---</i>")
         else:
             self.dining.resume()
             self.pause_btn.setText("暂停")
-            self.log_text.append("<i>--- 模拟继续 ---</i>")
+            self._append_log("<i>--- 模拟继续 ---</i>")
+        # 暂停期间的叉子事件会被丢弃，切换时主动检测一次，避免错过死锁
+        self._check_deadlock()
 
     def _stop(self):
         """停止模拟"""
-        self.deadlock_timer.stop()
         self.dining.stop()
-        self.table_widget.stop_animation()
+        # 丢弃尚未应用的叉子状态，避免覆盖下面的重置
+        self._fork_flush.stop()
+        with self._fork_lock:
+            self._latest_forks = None
+        self._pending_forks = None
+        self._prev_fork_sig = None
         self.table_widget.reset()
         self.start_btn.setEnabled(True)
         self.pause_btn.setEnabled(False)
@@ -416,20 +565,12 @@ class SyncModule(QWidget):
         self.deadlock_check.setEnabled(True)
 
         # 重置信号量表
-        for i in range(5):
-            self.sem_table.setItem(i, 1, QTableWidgetItem("1"))
-            self.sem_table.setItem(i, 2, QTableWidgetItem("-"))
-            self.sem_table.item(i, 1).setBackground(QColor(200, 255, 200))
+        self.fork_model.reset()
 
         self.deadlock_label.hide()
         self._deadlock_warned = False
 
-        self.log_text.append("<b>--- 模拟停止 ---</b>")
-
-    def _check_deadlock(self):
-        """定时检测死锁"""
-        if self.dining.check_deadlock() and not self._deadlock_warned:
-            self.signal_bridge.deadlock_detected.emit()
+        self._append_log("<b>--- 模拟停止 ---</b>")
 
     def _on_deadlock_detected(self):
         """处理死锁检测"""
@@ -441,7 +582,7 @@ class SyncModule(QWidget):
             "请点击「停止」并启用「死锁预防」后重试。"
         )
         self.deadlock_label.show()
-        self.log_text.append(
+        self._append_log(
             "<span style='color:#e74c3c; font-weight:bold;'>"
             "检测到死锁！系统陷入死锁状态。"
             "</span>"
@@ -449,6 +590,9 @@ class SyncModule(QWidget):
 
     def closeEvent(self, event):
         """关闭时停止线程"""
-        self.deadlock_timer.stop()
+        self._fork_flush.stop()
+        with self._fork_lock:
+            self._latest_forks = None
+        self._log_flush_timer.stop()
         self.dining.stop()
         super().closeEvent(event)
@@ -4,48 +4,227 @@
 """
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                              QGroupBox, QLabel, QComboBox, QSpinBox,
-                             QTableWidget, QTableWidgetItem, QHeaderView,
+                             QTableView, QHeaderView,
                              QMessageBox, QProgressBar, QSplitter, QTabWidget,
                              QFrame)
-from PyQt5.QtCore import Qt, QTimer, QRectF, QThread, pyqtSignal
-from PyQt5.QtGui import QColor, QPainter, QPen, QBrush, QFont, QPainterPath
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from PyQt5.QtCore import (Qt, QTimer, QRectF, QPointF, QObject, QThread,
+                          QAbstractTableModel, QModelIndex, pyqtSignal, pyqtSlot)
+from PyQt5.QtGui import (QColor, QPainter, QPen, QBrush, QFont, QFontMetrics,
+                         QPolygonF, QStaticText, QTransform)
+from datetime import datetime
+import time
 
 from core.system_monitor import create_monitor, SystemInfo
 
 
-class ProcessFetchThread(QThread):
-    """后台获取进程列表的线程"""
-    finished_signal = pyqtSignal(list)
+class MonitorWorker(QObject):
+    """在后台线程中周期采样系统信息和进程列表的工作对象"""
+    # 系统信息, CPU历史, 内存历史, 各核心使用率
+    system_info_ready = pyqtSignal(object, list, list, list)
+    # 进程列表, 与上次结果相比发生变化的行号
+    process_list_ready = pyqtSignal(list, list)
 
-    def __init__(self, monitor, sort_by="cpu", parent=None):
-        super().__init__(parent)
+    # 采样过慢时采样间隔的上限（毫秒）
+    MAX_INTERVAL = 5000
+    # 单次采样耗时超过基础间隔的该比例时视为过慢
+    SLOW_SAMPLE_RATIO = 0.5
+
+    def __init__(self, monitor):
+        super().__init__()
         self.monitor = monitor
-        self.sort_by = sort_by
+        self.sort_by = "cpu"
+        self.base_interval = 1000
+        self._interval = self.base_interval
+        self._previous: list = []
+        self._active = False
+        self._timer = None
+
+    @pyqtSlot(int)
+    def start(self, interval: int):
+        """开始周期采样（在工作线程中执行）"""
+        if self._timer is None:
+            self._timer = QTimer(self)
+            self._timer.setSingleShot(True)
+            self._timer.timeout.connect(self.sample)
+        self.base_interval = self._interval = interval
+        self._active = True
+        self.sample()
+
+    @pyqtSlot()
+    def stop(self):
+        """暂停采样"""
+        self._active = False
+        if self._timer is not None:
+            self._timer.stop()
+
+    @pyqtSlot(int)
+    def set_interval(self, interval: int):
+        """修改基础采样间隔"""
+        self.base_interval = self._interval = interval
+        if self._active:
+            self._timer.start(interval)
+
+    @pyqtSlot()
+    def sample(self):
+        """采样一次，并安排下一次采样"""
+        started = time.perf_counter()
+        info = self.monitor.get_system_info()
+        cpu_history = self.monitor.get_cpu_history()
+        memory_history = self.monitor.get_memory_history()
+        if info:
+            self.system_info_ready.emit(info, cpu_history, memory_history,
+                                        self.monitor.get_cpu_per_core())
 
-    def run(self):
         processes = self.monitor.get_process_list(sort_by=self.sort_by, limit=100)
-        self.finished_signal.emit(processes)
+        previous = self._previous
+        changed = [row for row, proc in enumerate(processes)
+                   if row >= len(previous) or proc != previous[row]]
+        self._previous = processes
+        self.process_list_ready.emit(processes, changed)
+
+        if self._active:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self._timer.start(self._next_interval(elapsed_ms))
+
+    def _next_interval(self, elapsed_ms: float) -> int:
+        """采样过慢时逐步放慢采样，否则恢复基础间隔"""
+        if elapsed_ms > self.base_interval * self.SLOW_SAMPLE_RATIO:
+            self._interval = min(self._interval * 2, max(self.MAX_INTERVAL, self.base_interval))
+        else:
+            self._interval = self.base_interval
+        return self._interval
+
+
+class SystemProcessTableModel(QAbstractTableModel):
+    """系统进程表格模型（缓存各行显示文本，只通知变化的行）"""
+
+    HEADERS = ["PID", "名称", "状态", "CPU%", "内存%", "内存(MB)", "线程数", "用户"]
+    CPU_COLUMN = 3
+    MEMORY_COLUMN = 4
+
+    # 高占用单元格背景
+    HOT_CPU_BRUSH = QBrush(QColor(0xFF, 0xCD, 0xD2))
+    HOT_MEM_BRUSH = QBrush(QColor(0xFF, 0xEC, 0xB3))
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cells = []
+        # 各行 (CPU列背景, 内存列背景)，None 表示默认背景
+        self._backgrounds = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._cells)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._cells[index.row()][index.column()]
+        if role == Qt.BackgroundRole:
+            column = index.column()
+            if column == self.CPU_COLUMN:
+                return self._backgrounds[index.row()][0]
+            if column == self.MEMORY_COLUMN:
+                return self._backgrounds[index.row()][1]
+        return None
+
+    @staticmethod
+    def _format_row(proc) -> tuple:
+        """生成一行的显示文本"""
+        return (str(proc.pid), proc.name, proc.status,
+                "%.1f" % proc.cpu_percent, "%.1f" % proc.memory_percent,
+                "%.1f" % proc.memory_mb, str(proc.threads), proc.username)
+
+    def _background(self, proc) -> tuple:
+        """生成一行的高占用背景"""
+        return (self.HOT_CPU_BRUSH if proc.cpu_percent > 50 else None,
+                self.HOT_MEM_BRUSH if proc.memory_percent > 10 else None)
+
+    def set_processes(self, processes: list, changed: list):
+        """更新进程列表，changed 为内容发生变化的行号（显示文本不变的行不通知）"""
+        old_count = len(self._cells)
+        new_count = len(processes)
+
+        if new_count < old_count:
+            self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
+            del self._cells[new_count:]
+            del self._backgrounds[new_count:]
+            self.endRemoveRows()
+
+        last_column = len(self.HEADERS) - 1
+        for row in changed:
+            if row >= old_count:
+                break
+            proc = processes[row]
+            cells = self._format_row(proc)
+            background = self._background(proc)
+            if cells == self._cells[row] and background == self._backgrounds[row]:
+                continue
+            self._cells[row] = cells
+            self._backgrounds[row] = background
+            self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+
+        if new_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+            for proc in processes[old_count:]:
+                self._cells.append(self._format_row(proc))
+                self._backgrounds.append(self._background(proc))
+            self.endInsertRows()
 
 
 class UsageGraphWidget(QWidget):
     """使用率图表组件"""
 
+    BACKGROUND_COLOR = QColor(0x1E, 0x1E, 0x1E)
+    BORDER_PEN = QPen(QColor(0x33, 0x33, 0x33), 1)
+    GRID_PEN = QPen(QColor(0x33, 0x33, 0x33), 1, Qt.DotLine)
+    SCALE_PEN = QPen(QColor(0x66, 0x66, 0x66))
+
     def __init__(self, title: str = "CPU", color: str = "#2196F3", parent=None):
         super().__init__(parent)
         self.title = title
         self.color = QColor(color)
+        fill_color = QColor(self.color)
+        fill_color.setAlpha(50)
+        self._fill_brush = QBrush(fill_color)
+        self._line_pen = QPen(self.color, 2)
+        self._title_pen = QPen(self.color)
+        self._title_font = QFont("Microsoft YaHei", 9, QFont.Bold)
+        # 刻度文字固定不变，预先排版为静态文本
+        self._scale_font = QFont("Microsoft YaHei", 7)
+        self._scale_ascent = QFontMetrics(self._scale_font).ascent()
+        self._scale_labels = []
+        for text in ("100%", "50%", "0%"):
+            label = QStaticText(text)
+            label.prepare(QTransform(), self._scale_font)
+            self._scale_labels.append(label)
         self.history: list = []
         self.max_points = 60
         self.current_value = 0
+        # 各采样点的横坐标只取决于控件宽度，尺寸变化时重新计算
+        self._x_coords: list = []
         self.setMinimumHeight(120)
         self.setMinimumWidth(200)
 
+    def resizeEvent(self, event):
+        """尺寸变化时使横坐标缓存失效"""
+        self._x_coords = []
+        super().resizeEvent(event)
+
     def set_data(self, history: list, current: float):
-        """设置数据"""
-        self.history = history[-self.max_points:]
+        """设置数据（数据未变化时不重绘）"""
+        history = history[-self.max_points:]
+        if history == self.history and current == self.current_value:
+            return
+        self.history = history
         self.current_value = current
         self.update()
 
@@ -58,93 +237,97 @@ class UsageGraphWidget(QWidget):
         height = self.height()
 
         # 绘制背景
-        painter.fillRect(0, 0, width, height, QColor("#1E1E1E"))
+        painter.fillRect(0, 0, width, height, self.BACKGROUND_COLOR)
 
         # 绘制边框
-        painter.setPen(QPen(QColor("#333"), 1))
+        painter.setPen(self.BORDER_PEN)
         painter.drawRect(0, 0, width - 1, height - 1)
 
         # 绘制网格线
-        painter.setPen(QPen(QColor("#333"), 1, Qt.DotLine))
+        painter.setPen(self.GRID_PEN)
         for i in range(1, 4):
             y = height * i // 4
             painter.drawLine(0, y, width, y)
 
-        # 绘制刻度
-        painter.setPen(QPen(QColor("#666")))
-        painter.setFont(QFont("Microsoft YaHei", 7))
-        painter.drawText(5, 12, "100%")
-        painter.drawText(5, height // 2, "50%")
-        painter.drawText(5, height - 5, "0%")
+        # 绘制刻度（静态文本以左上角定位，由基线位置减去字体上升高度得到）
+        painter.setPen(self.SCALE_PEN)
+        painter.setFont(self._scale_font)
+        for label, baseline in zip(self._scale_labels, (12, height // 2, height - 5)):
+            painter.drawStaticText(5, baseline - self._scale_ascent, label)
 
         # 绘制标题
-        painter.setFont(QFont("Microsoft YaHei", 9, QFont.Bold))
-        painter.setPen(QPen(self.color))
+        painter.setFont(self._title_font)
+        painter.setPen(self._title_pen)
         painter.drawText(width - 100, 15, f"{self.title}: {self.current_value:.1f}%")
 
         # 绘制曲线
         if len(self.history) > 1:
-            graph_left = 35
-            graph_width = width - graph_left - 10
-            graph_height = height - 20
-
-            # 创建路径
-            path = QPainterPath()
-
-            # 填充区域
-            fill_path = QPainterPath()
-
-            point_spacing = graph_width / (self.max_points - 1)
-
-            for i, value in enumerate(self.history):
-                x = graph_left + i * point_spacing
-                y = height - 10 - (value / 100.0) * graph_height
-
-                if i == 0:
-                    path.moveTo(x, y)
-                    fill_path.moveTo(x, height - 10)
-                    fill_path.lineTo(x, y)
-                else:
-                    path.lineTo(x, y)
-                    fill_path.lineTo(x, y)
-
-            # 闭合填充路径
-            if self.history:
-                last_x = graph_left + (len(self.history) - 1) * point_spacing
-                fill_path.lineTo(last_x, height - 10)
-                fill_path.closeSubpath()
+            if not self._x_coords:
+                graph_left = 35
+                point_spacing = (width - graph_left - 10) / (self.max_points - 1)
+                self._x_coords = [graph_left + i * point_spacing
+                                  for i in range(self.max_points)]
+            baseline = height - 10
+            y_scale = (height - 20) / 100.0
+
+            # 一次性生成折线顶点
+            points = [QPointF(x, baseline - value * y_scale)
+                      for x, value in zip(self._x_coords, self.history)]
+            line = QPolygonF(points)
+
+            # 填充区域：折线两端向下闭合到基线
+            fill = QPolygonF([QPointF(points[0].x(), baseline)] + points
+                             + [QPointF(points[-1].x(), baseline)])
 
             # 绘制填充
-            fill_color = QColor(self.color)
-            fill_color.setAlpha(50)
-            painter.fillPath(fill_path, QBrush(fill_color))
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self._fill_brush)
+            painter.drawPolygon(fill)
 
             # 绘制线条
-            painter.setPen(QPen(self.color, 2))
-            painter.drawPath(path)
+            painter.setPen(self._line_pen)
+            painter.setBrush(Qt.NoBrush)
+            painter.drawPolyline(line)
 
 
 class CpuCoreWidget(QWidget):
     """CPU核心使用率组件"""
 
+    BRUSH_BACKGROUND = QBrush(QColor(0x33, 0x33, 0x33))
+    # 按使用率档位索引：<=50%, <=80%, >80%
+    USAGE_BRUSHES = (
+        QBrush(QColor(0x4C, 0xAF, 0x50)),
+        QBrush(QColor(0xFF, 0x98, 0x00)),
+        QBrush(QColor(0xF4, 0x43, 0x36)),
+    )
+    LABEL_PEN = QPen(QColor(0x99, 0x99, 0x99))
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.core_usage: list = []
+        self._label_font = QFont("Microsoft YaHei", 7)
+        # 每个核心的 (x, 标签区域)，在尺寸或核心数变化时重新计算
+        self._bars: list = []
+        self._bar_width = 0
+        self._bar_height = 0
         self.setMinimumHeight(60)
 
     def set_data(self, usage: list):
-        """设置数据"""
+        """设置数据（数据未变化时不重绘）"""
+        if usage == self.core_usage:
+            return
+        if len(usage) != len(self.core_usage):
+            self._bars = []
         self.core_usage = usage
         self.update()
 
-    def paintEvent(self, event):
-        """绘制CPU核心"""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        if not self.core_usage:
-            return
+    def resizeEvent(self, event):
+        """尺寸变化时使几何缓存失效"""
+        self._bars = []
+        super().resizeEvent(event)
 
+    def _layout_bars(self):
+        """计算每个核心柱条的位置"""
         width = self.width()
         height = self.height()
         n = len(self.core_usage)
@@ -154,46 +337,75 @@ class CpuCoreWidget(QWidget):
         total_width = n * (bar_width + spacing) - spacing
         start_x = (width - total_width) // 2
 
-        for i, usage in enumerate(self.core_usage):
+        self._bar_width = bar_width
+        self._bar_height = height - 25
+        self._bars = []
+        for i in range(n):
             x = start_x + i * (bar_width + spacing)
-            bar_height = height - 25
+            self._bars.append((x, QRectF(x, height - 18, bar_width, 15)))
 
-            # 背景条
-            painter.setBrush(QBrush(QColor("#333")))
-            painter.setPen(Qt.NoPen)
+    def paintEvent(self, event):
+        """绘制CPU核心"""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        if not self.core_usage:
+            return
+        if not self._bars:
+            self._layout_bars()
+
+        bar_width = self._bar_width
+        bar_height = self._bar_height
+        brushes = self.USAGE_BRUSHES
+
+        # 背景条与使用率条
+        painter.setPen(Qt.NoPen)
+        for (x, _), usage in zip(self._bars, self.core_usage):
+            painter.setBrush(self.BRUSH_BACKGROUND)
             painter.drawRoundedRect(x, 5, bar_width, bar_height, 3, 3)
 
-            # 使用率条
             used_height = int((usage / 100.0) * bar_height)
-            if usage > 80:
-                color = QColor("#F44336")
-            elif usage > 50:
-                color = QColor("#FF9800")
-            else:
-                color = QColor("#4CAF50")
-
-            painter.setBrush(QBrush(color))
+            painter.setBrush(brushes[(usage > 50) + (usage > 80)])
             painter.drawRoundedRect(x, 5 + bar_height - used_height,
-                                   bar_width, used_height, 3, 3)
+                                    bar_width, used_height, 3, 3)
 
-            # 标签
-            painter.setPen(QPen(QColor("#999")))
-            painter.setFont(QFont("Microsoft YaHei", 7))
-            painter.drawText(QRectF(x, height - 18, bar_width, 15),
-                           Qt.AlignCenter, f"C{i}")
+        # 标签
+        painter.setPen(self.LABEL_PEN)
+        painter.setFont(self._label_font)
+        for i, (_, label_rect) in enumerate(self._bars):
+            painter.drawText(label_rect, Qt.AlignCenter, f"C{i}")
 
 
 class TaskManagerModule(QWidget):
     """系统任务管理器模块"""
+    # 发往采样线程的请求（跨线程排队执行）
+    _start_sampling = pyqtSignal(int)
+    _stop_sampling = pyqtSignal()
+    _sample_now = pyqtSignal()
+    _interval_changed = pyqtSignal(int)
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.monitor = create_monitor()
         self.refresh_interval = 1000  # 1秒刷新
-        self._process_thread = None
+        self._refreshing = False
         self._init_ui()
+        self._init_worker()
         # 不立即启动刷新，等待主窗口切换到此标签时启动
 
+    def _init_worker(self):
+        """创建常驻的采样线程"""
+        self._worker_thread = QThread()
+        self._worker = MonitorWorker(self.monitor)
+        self._worker.moveToThread(self._worker_thread)
+        self._worker.system_info_ready.connect(self._on_system_info_ready)
+        self._worker.process_list_ready.connect(self._on_process_list_ready)
+        self._start_sampling.connect(self._worker.start)
+        self._stop_sampling.connect(self._worker.stop)
+        self._sample_now.connect(self._worker.sample)
+        self._interval_changed.connect(self._worker.set_interval)
+        self._worker_thread.start()
+
     def _init_ui(self):
         layout = QVBoxLayout(self)
         layout.setSpacing(10)
@@ -267,7 +479,7 @@ class TaskManagerModule(QWidget):
         process_header_layout.addWidget(QLabel("排序:"))
         self.sort_combo = QComboBox()
         self.sort_combo.addItems(["CPU使用率", "内存使用率", "PID", "名称"])
-        self.sort_combo.currentIndexChanged.connect(self._refresh_process_list)
+        self.sort_combo.currentIndexChanged.connect(self._on_sort_changed)
         process_header_layout.addWidget(self.sort_combo)
 
         process_header_layout.addWidget(QLabel("刷新间隔:"))
@@ -288,16 +500,14 @@ class TaskManagerModule(QWidget):
         process_layout.addWidget(process_header)
 
         # 进程表格
-        self.process_table = QTableWidget()
-        self.process_table.setColumnCount(8)
-        self.process_table.setHorizontalHeaderLabels([
-            "PID", "名称", "状态", "CPU%", "内存%", "内存(MB)", "线程数", "用户"
-        ])
+        self.process_model = SystemProcessTableModel(self)
+        self.process_table = QTableView()
+        self.process_table.setModel(self.process_model)
         self.process_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.process_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
         self.process_table.setAlternatingRowColors(True)
         self.process_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 alternate-background-color: #f5f5f5;
             }
         """)
@@ -327,49 +537,48 @@ class TaskManagerModule(QWidget):
 
         layout.addWidget(status_group)
 
-        # 刷新定时器
-        self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self._refresh_all)
-
     def _start_refresh(self):
-        """开始刷新"""
-        self.refresh_timer.start(self.refresh_interval)
-        self._refresh_all()
+        """开始周期刷新"""
+        if self._refreshing:
+            return
+        self._refreshing = True
+        self._start_sampling.emit(self.refresh_interval)
+
+    def _stop_refresh(self):
+        """暂停周期刷新"""
+        if not self._refreshing:
+            return
+        self._refreshing = False
+        self._stop_sampling.emit()
 
     def _on_refresh_changed(self, value: int):
         """刷新间隔改变"""
         self.refresh_interval = value
-        self.refresh_timer.setInterval(value)
+        self._interval_changed.emit(value)
 
     def _refresh_all(self):
-        """刷新所有数据"""
-        # 更新时间
-        from datetime import datetime
+        """立即刷新所有数据（在采样线程中执行）"""
+        self._sample_now.emit()
+
+    def _on_sort_changed(self, index: int):
+        """排序方式改变"""
+        sort_options = ["cpu", "memory", "pid", "name"]
+        # 采样线程每次采样时读取该属性
+        self._worker.sort_by = sort_options[index]
+        self._refresh_all()
+
+    def _on_system_info_ready(self, info: SystemInfo, cpu_history: list,
+                              memory_history: list, core_usage: list):
+        """系统信息采样完成"""
         self.last_update_label.setText(
             f"最后更新: {datetime.now().strftime('%H:%M:%S')}"
         )
 
-        # 刷新系统信息（快速，同步执行）
-        self._refresh_system_info()
-
-        # 刷新进程列表（慢，后台线程执行）
-        self._refresh_process_list()
-
-    def _refresh_system_info(self):
-        """刷新系统信息"""
-        info = self.monitor.get_system_info()
-        if not info:
-            return
-
         # 更新图表
-        cpu_history = self.monitor.get_cpu_history()
-        memory_history = self.monitor.get_memory_history()
-
         self.cpu_graph.set_data(cpu_history, info.cpu_percent)
         self.memory_graph.set_data(memory_history, info.memory_percent)
 
         # 更新CPU核心
-        core_usage = self.monitor.get_cpu_per_core()
         self.cpu_core_widget.set_data(core_usage)
 
         # 更新文本信息
@@ -385,45 +594,15 @@ class TaskManagerModule(QWidget):
         self.boot_time_label.setText(f"启动时间: {info.boot_time}")
         self.process_count_label.setText(f"进程数: {info.process_count}")
 
-    def _refresh_process_list(self):
-        """刷新进程列表（后台线程）"""
-        # 如果上一个线程还在运行，跳过
-        if self._process_thread and self._process_thread.isRunning():
-            return
-
-        sort_options = ["cpu", "memory", "pid", "name"]
-        sort_by = sort_options[self.sort_combo.currentIndex()]
-
-        self._process_thread = ProcessFetchThread(self.monitor, sort_by)
-        self._process_thread.finished_signal.connect(self._on_process_list_ready)
-        self._process_thread.start()
-
-    def _on_process_list_ready(self, processes):
-        """进程列表获取完成"""
-        self.process_table.setRowCount(len(processes))
-
-        for row, proc in enumerate(processes):
-            self.process_table.setItem(row, 0, QTableWidgetItem(str(proc.pid)))
-            self.process_table.setItem(row, 1, QTableWidgetItem(proc.name))
-            self.process_table.setItem(row, 2, QTableWidgetItem(proc.status))
-
-            cpu_item = QTableWidgetItem(f"{proc.cpu_percent:.1f}")
-            if proc.cpu_percent > 50:
-                cpu_item.setBackground(QColor("#FFCDD2"))
-            self.process_table.setItem(row, 3, cpu_item)
-
-            mem_item = QTableWidgetItem(f"{proc.memory_percent:.1f}")
-            if proc.memory_percent > 10:
-                mem_item.setBackground(QColor("#FFECB3"))
-            self.process_table.setItem(row, 4, mem_item)
-
-            self.process_table.setItem(row, 5, QTableWidgetItem(f"{proc.memory_mb:.1f}"))
-            self.process_table.setItem(row, 6, QTableWidgetItem(str(proc.threads)))
-            self.process_table.setItem(row, 7, QTableWidgetItem(proc.username))
+    def _on_process_list_ready(self, processes, changed):
+        """进程列表获取完成，只通知发生变化的行"""
+        self.process_model.set_processes(processes, changed)
 
     def closeEvent(self, event):
         """关闭事件"""
-        self.refresh_timer.stop()
-        if self._process_thread and self._process_thread.isRunning():
-            self._process_thread.wait(1000)
+        self._stop_refresh()
+        if self._worker_thread.isRunning():
+            self._worker_thread.quit()
+            # 单次采样可能耗时较长，必须等线程真正结束，否则销毁时 Qt 会中止程序
+            self._worker_thread.wait()
         super().closeEvent(event)
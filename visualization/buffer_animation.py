@@ -1,55 +1,82 @@
 """
 共享缓冲区动画组件（用于生产者-消费者模型）
 """
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame,
+                             QSizePolicy)
 from PyQt5.QtGui import QPainter, QPen, QBrush, QColor, QFont, QLinearGradient
 from PyQt5.QtCore import Qt, QRectF, QTimer, QPropertyAnimation, QEasingCurve
 from typing import List, Optional
-import sys
-sys.path.append('..')
 from core.ipc import BufferItem
 
 
-class BufferSlotWidget(QWidget):
-    """缓冲区槽位组件"""
+class BufferSlotsWidget(QWidget):
+    """缓冲区槽位组件（在一次绘制中画出所有槽位）"""
 
-    def __init__(self, index: int, parent=None):
+    SLOT_SIZE = 50
+    SLOT_SPACING = 5
+
+    FILLED_PEN = QPen(QColor(60, 140, 180), 2)
+    EMPTY_PEN = QPen(QColor(180, 180, 180), 2, Qt.DashLine)
+    EMPTY_BRUSH = QBrush(QColor(240, 240, 240))
+    TEXT_PEN = QPen(QColor(255, 255, 255))
+
+    def __init__(self, capacity: int, parent=None):
         super().__init__(parent)
-        self.index = index
-        self.item: Optional[BufferItem] = None
-        self.setFixedSize(50, 50)
+        # 所有槽位处于同一行且高度固定，共用一个纵向渐变
+        gradient = QLinearGradient(0, 0, 0, self.SLOT_SIZE)
+        gradient.setColorAt(0, QColor(100, 180, 220))
+        gradient.setColorAt(1, QColor(60, 140, 180))
+        self._filled_brush = QBrush(gradient)
+        self._text_font = QFont("Microsoft YaHei", 8, QFont.Bold)
+        self.items: List[BufferItem] = []
+        self.capacity = 0
+        self.setFixedHeight(self.SLOT_SIZE)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.set_capacity(capacity)
 
-    def set_item(self, item: Optional[BufferItem]):
-        """设置槽位中的项"""
-        self.item = item
+    def set_capacity(self, capacity: int):
+        """设置槽位数量"""
+        self.capacity = capacity
+        self.setMinimumWidth(self._min_width())
+        self.update()
+
+    def _min_width(self) -> int:
+        """所有槽位紧密排列时所需的宽度"""
+        return max(self.capacity * (self.SLOT_SIZE + self.SLOT_SPACING) - self.SLOT_SPACING, 0)
+
+    def set_items(self, items: List[BufferItem]):
+        """设置各槽位中的项"""
+        self.items = items
         self.update()
 
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
 
-        rect = QRectF(2, 2, self.width() - 4, self.height() - 4)
-
-        if self.item:
-            # 有数据 - 显示填充状态
-            gradient = QLinearGradient(0, 0, 0, self.height())
-            gradient.setColorAt(0, QColor(100, 180, 220))
-            gradient.setColorAt(1, QColor(60, 140, 180))
-
-            painter.setPen(QPen(QColor(60, 140, 180), 2))
-            painter.setBrush(QBrush(gradient))
-            painter.drawRoundedRect(rect, 5, 5)
+        size = self.SLOT_SIZE
+        # 多余的宽度均匀分配到槽位两侧和槽位之间
+        gap = max(self.width() - self._min_width(), 0) / (self.capacity + 1)
+        pitch = size + self.SLOT_SPACING + gap
+        painter.setFont(self._text_font)
 
-            # 显示数据ID
-            painter.setPen(QPen(QColor(255, 255, 255)))
-            font = QFont("Microsoft YaHei", 8, QFont.Bold)
-            painter.setFont(font)
-            painter.drawText(rect, Qt.AlignCenter, f"{self.item.id}")
-        else:
-            # 空槽位
-            painter.setPen(QPen(QColor(180, 180, 180), 2, Qt.DashLine))
-            painter.setBrush(QBrush(QColor(240, 240, 240)))
-            painter.drawRoundedRect(rect, 5, 5)
+        for i in range(self.capacity):
+            rect = QRectF(gap + i * pitch + 2, 2, size - 4, size - 4)
+            item = self.items[i] if i < len(self.items) else None
+
+            if item:
+                # 有数据 - 显示填充状态
+                painter.setPen(self.FILLED_PEN)
+                painter.setBrush(self._filled_brush)
+                painter.drawRoundedRect(rect, 5, 5)
+
+                # 显示数据ID
+                painter.setPen(self.TEXT_PEN)
+                painter.drawText(rect, Qt.AlignCenter, f"{item.id}")
+            else:
+                # 空槽位
+                painter.setPen(self.EMPTY_PEN)
+                painter.setBrush(self.EMPTY_BRUSH)
+                painter.drawRoundedRect(rect, 5, 5)
 
 
 class BufferAnimationWidget(QWidget):
@@ -58,7 +85,6 @@ class BufferAnimationWidget(QWidget):
     def __init__(self, capacity: int = 10, parent=None):
         super().__init__(parent)
         self.capacity = capacity
-        self.slots: List[BufferSlotWidget] = []
         self._init_ui()
 
     def _init_ui(self):
@@ -83,11 +109,9 @@ class BufferAnimationWidget(QWidget):
         buffer_layout.setSpacing(5)
         buffer_layout.setContentsMargins(10, 10, 10, 10)
 
-        # 创建槽位
-        for i in range(self.capacity):
-            slot = BufferSlotWidget(i)
-            self.slots.append(slot)
-            buffer_layout.addWidget(slot)
+        # 槽位
+        self.slots_widget = BufferSlotsWidget(self.capacity)
+        buffer_layout.addWidget(self.slots_widget)
 
         buffer_container.setStyleSheet("""
             QWidget {
@@ -110,12 +134,8 @@ class BufferAnimationWidget(QWidget):
         if capacity != self.capacity:
             self._resize_slots(capacity)
 
-        # 更新槽位内容
-        for i, slot in enumerate(self.slots):
-            if i < len(items):
-                slot.set_item(items[i])
-            else:
-                slot.set_item(None)
+        # 更新槽位内容（只触发一次重绘）
+        self.slots_widget.set_items(items)
 
         # 更新状态
         self.status_label.setText(f"容量: {len(items)} / {self.capacity}")
@@ -136,25 +156,7 @@ class BufferAnimationWidget(QWidget):
     def _resize_slots(self, new_capacity: int):
         """调整槽位数量"""
         self.capacity = new_capacity
-
-        # 获取布局
-        container = self.slots[0].parent() if self.slots else None
-        if not container:
-            return
-
-        layout = container.layout()
-
-        # 移除多余槽位
-        while len(self.slots) > new_capacity:
-            slot = self.slots.pop()
-            layout.removeWidget(slot)
-            slot.deleteLater()
-
-        # 添加新槽位
-        while len(self.slots) < new_capacity:
-            slot = BufferSlotWidget(len(self.slots))
-            self.slots.append(slot)
-            layout.addWidget(slot)
+        self.slots_widget.set_capacity(new_capacity)
 
     def set_capacity(self, capacity: int):
         """设置缓冲区容量"""
@@ -163,8 +165,7 @@ class BufferAnimationWidget(QWidget):
 
     def clear(self):
         """清空缓冲区显示"""
-        for slot in self.slots:
-            slot.set_item(None)
+        self.slots_widget.set_items([])
         self.status_label.setText(f"容量: 0 / {self.capacity}")
 
 
@@ -2,11 +2,10 @@
 甘特图可视化组件
 """
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QScrollArea
-from PyQt5.QtGui import QPainter, QPen, QBrush, QColor, QFont
+from PyQt5.QtGui import QPainter, QPen, QBrush, QColor, QFont, QPixmap
 from PyQt5.QtCore import Qt, QRectF, QTimer
-from typing import List
-import sys
-sys.path.append('..')
+from typing import List, Optional
+from bisect import bisect_left
 from core.scheduler import GanttBlock
 
 
@@ -26,16 +25,26 @@ class GanttChartWidget(QWidget):
         QColor(150, 200, 100),   # 浅绿
         QColor(180, 120, 120),   # 浅红
     ]
+    # 与调色板一一对应的块边框和填充
+    BLOCK_PENS = [QPen(color.darker(120), 1) for color in COLORS]
+    BLOCK_BRUSHES = [QBrush(color) for color in COLORS]
+    BLOCK_TEXT_PEN = QPen(QColor(255, 255, 255))
+    INDICATOR_PEN = QPen(QColor(255, 50, 50), 2)
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(600, 200)
         self.gantt_blocks: List[GanttBlock] = []
+        self._max_time = 0  # 所有块的最大结束时间
+        self._block_starts: List[float] = []  # 按开始时间排序的各块开始时间
+        self._block_spans: list = []  # 各块的 (x, 完整宽度)
         self.time_scale = 30  # 每个时间单位的像素宽度
         self.row_height = 40
         self.margin_left = 80
         self.margin_top = 40
         self.margin_bottom = 30
+        self._block_font = QFont("Microsoft YaHei", 9, QFont.Bold)
+        self._indicator_font = QFont("Microsoft YaHei", 9, QFont.Bold)
 
         # 动画相关
         self._current_time = 0
@@ -43,30 +52,48 @@ class GanttChartWidget(QWidget):
         self._animation_timer.timeout.connect(self._animate_step)
         self._animating = False
 
+        # 网格、时间轴和标签不随动画变化，缓存为位图
+        self._static_pixmap: Optional[QPixmap] = None
+
     def set_data(self, blocks: List[GanttBlock]):
         """设置甘特图数据"""
-        self.gantt_blocks = blocks
-        self._current_time = max([b.end_time for b in blocks]) if blocks else 0
+        self._set_blocks(blocks)
+        self._current_time = self._max_time
         self._animating = False
         self._animation_timer.stop()
+        self._static_pixmap = None
         self.update()
         self._update_size()
 
+    def _set_blocks(self, blocks: List[GanttBlock]):
+        """保存甘特图块（按开始时间排序）并计算最大结束时间"""
+        self.gantt_blocks = sorted(blocks, key=lambda b: b.start_time)
+        self._max_time = max((b.end_time for b in blocks), default=0)
+        self._block_starts = [b.start_time for b in self.gantt_blocks]
+        self._layout_blocks()
+
+    def _layout_blocks(self):
+        """计算各块的横坐标和完整宽度"""
+        left = self.margin_left
+        scale = self.time_scale
+        self._block_spans = [(left + b.start_time * scale, (b.end_time - b.start_time) * scale)
+                             for b in self.gantt_blocks]
+
     def _update_size(self):
         """更新组件大小"""
         if not self.gantt_blocks:
             return
-        max_time = max([b.end_time for b in self.gantt_blocks])
-        width = int(self.margin_left + max_time * self.time_scale + 50)
+        width = int(self.margin_left + self._max_time * self.time_scale + 50)
         height = int(self.margin_top + self.row_height + self.margin_bottom + 30)
         self.setMinimumWidth(width)
         self.setMinimumHeight(height)
 
     def start_animation(self, blocks: List[GanttBlock], speed: float = 0.5):
         """启动动画播放"""
-        self.gantt_blocks = blocks
+        self._set_blocks(blocks)
         self._current_time = 0
         self._animating = True
+        self._static_pixmap = None
         self._animation_timer.start(int(speed * 1000))
         self._update_size()
 
@@ -75,7 +102,7 @@ class GanttChartWidget(QWidget):
         self._animating = False
         self._animation_timer.stop()
         if self.gantt_blocks:
-            self._current_time = max([b.end_time for b in self.gantt_blocks])
+            self._current_time = self._max_time
         self.update()
 
     def _animate_step(self):
@@ -83,10 +110,9 @@ class GanttChartWidget(QWidget):
         if not self.gantt_blocks:
             return
 
-        max_time = max([b.end_time for b in self.gantt_blocks])
         self._current_time += 1
 
-        if self._current_time > max_time:
+        if self._current_time > self._max_time:
             self.stop_animation()
             return
 
@@ -102,32 +128,47 @@ class GanttChartWidget(QWidget):
             painter.drawText(self.rect(), Qt.AlignCenter, "暂无调度数据")
             return
 
-        # 绘制背景网格
-        self._draw_grid(painter)
+        # 绘制背景网格、时间轴和进程标签（缓存位图）
+        if self._static_pixmap is None:
+            self._static_pixmap = self._render_static()
+        painter.drawPixmap(0, 0, self._static_pixmap)
 
         # 绘制甘特图块
         self._draw_blocks(painter)
 
-        # 绘制时间轴
-        self._draw_time_axis(painter)
-
-        # 绘制进程标签
-        self._draw_labels(painter)
-
         # 绘制当前时间指示线（动画时）
         if self._animating:
             self._draw_time_indicator(painter)
 
+    def _render_static(self) -> QPixmap:
+        """将网格、时间轴和标签绘制到位图中"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        self._draw_grid(painter)
+        self._draw_time_axis(painter)
+        self._draw_labels(painter)
+        painter.end()
+        return pixmap
+
+    def resizeEvent(self, event):
+        """尺寸变化时重建静态位图"""
+        self._static_pixmap = None
+        super().resizeEvent(event)
+
     def _draw_grid(self, painter: QPainter):
         """绘制背景网格"""
         if not self.gantt_blocks:
             return
 
-        max_time = max([b.end_time for b in self.gantt_blocks])
         painter.setPen(QPen(QColor(230, 230, 230), 1, Qt.DashLine))
 
         # 绘制垂直网格线
-        for t in range(int(max_time) + 1):
+        for t in range(int(self._max_time) + 1):
             x = self.margin_left + t * self.time_scale
             painter.drawLine(int(x), self.margin_top, int(x),
                            self.margin_top + self.row_height)
@@ -135,33 +176,31 @@ class GanttChartWidget(QWidget):
     def _draw_blocks(self, painter: QPainter):
         """绘制甘特图块"""
         y = self.margin_top
+        block_height = self.row_height - 10
+        blocks = self.gantt_blocks
+        current = self._current_time
+        palette_size = len(self.COLORS)
+        painter.setFont(self._block_font)
 
-        for block in self.gantt_blocks:
-            # 动画时只显示当前时间之前的部分
-            if self._animating:
-                if block.start_time >= self._current_time:
-                    continue
-                end_time = min(block.end_time, self._current_time)
-            else:
-                end_time = block.end_time
-
-            x = self.margin_left + block.start_time * self.time_scale
-            width = (end_time - block.start_time) * self.time_scale
+        # 动画时只显示当前时间之前开始的块
+        count = bisect_left(self._block_starts, current) if self._animating else len(blocks)
 
-            # 获取颜色
-            color = self.COLORS[block.color_index % len(self.COLORS)]
+        for i in range(count):
+            block = blocks[i]
+            x, width = self._block_spans[i]
+            if self._animating and block.end_time > current:
+                width = (current - block.start_time) * self.time_scale
 
             # 绘制矩形
-            painter.setPen(QPen(color.darker(120), 1))
-            painter.setBrush(QBrush(color))
-            rect = QRectF(x, y + 5, width, self.row_height - 10)
+            color_index = block.color_index % palette_size
+            painter.setPen(self.BLOCK_PENS[color_index])
+            painter.setBrush(self.BLOCK_BRUSHES[color_index])
+            rect = QRectF(x, y + 5, width, block_height)
             painter.drawRoundedRect(rect, 3, 3)
 
             # 绘制进程名称（如果块足够宽）
             if width > 30:
-                painter.setPen(QPen(QColor(255, 255, 255)))
-                font = QFont("Microsoft YaHei", 9, QFont.Bold)
-                painter.setFont(font)
+                painter.setPen(self.BLOCK_TEXT_PEN)
                 painter.drawText(rect, Qt.AlignCenter, block.name)
 
     def _draw_time_axis(self, painter: QPainter):
@@ -169,7 +208,7 @@ class GanttChartWidget(QWidget):
         if not self.gantt_blocks:
             return
 
-        max_time = max([b.end_time for b in self.gantt_blocks])
+        max_time = self._max_time
         y = self.margin_top + self.row_height + 10
 
         painter.setPen(QPen(QColor(80, 80, 80), 2))
@@ -194,24 +233,27 @@ class GanttChartWidget(QWidget):
     def _draw_time_indicator(self, painter: QPainter):
         """绘制当前时间指示线"""
         x = self.margin_left + self._current_time * self.time_scale
-        painter.setPen(QPen(QColor(255, 50, 50), 2))
+        painter.setPen(self.INDICATOR_PEN)
         painter.drawLine(int(x), self.margin_top - 10,
                         int(x), self.margin_top + self.row_height + 10)
 
         # 绘制时间标签
-        painter.setFont(QFont("Microsoft YaHei", 9, QFont.Bold))
+        painter.setFont(self._indicator_font)
         painter.drawText(int(x - 15), self.margin_top - 15, f"T={self._current_time}")
 
     def set_time_scale(self, scale: int):
         """设置时间刻度"""
         self.time_scale = scale
+        self._layout_blocks()
+        self._static_pixmap = None
         self._update_size()
         self.update()
 
     def clear(self):
         """清空甘特图"""
-        self.gantt_blocks = []
+        self._set_blocks([])
         self._current_time = 0
         self._animating = False
         self._animation_timer.stop()
+        self._static_pixmap = None
         self.update()
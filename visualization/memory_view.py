@@ -2,12 +2,9 @@
 内存可视化组件
 """
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
-from PyQt5.QtCore import Qt, QTimer, QRectF
-from PyQt5.QtGui import QPainter, QColor, QBrush, QPen, QFont, QFontMetrics
-from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from PyQt5.QtCore import Qt, QTimer, QRect, QRectF
+from PyQt5.QtGui import QPainter, QColor, QBrush, QPen, QFont, QFontMetrics, QPixmap
+from typing import List, Optional
 
 from core.memory import MemoryBlock
 
@@ -30,69 +27,130 @@ PROCESS_COLORS = [
 class MemoryBlockWidget(QWidget):
     """内存块可视化组件"""
 
+    PROCESS_BRUSHES = [QBrush(QColor(color)) for color in PROCESS_COLORS]
+    FREE_BRUSH = QBrush(QColor("#E8E8E8"))
+    UNKNOWN_BRUSH = QBrush(QColor("#999"))
+    BORDER_PEN = QPen(QColor("#333"), 2)
+    BLOCK_PEN = QPen(QColor("#666"), 1)
+    TEXT_PEN = QPen(QColor("#333"))
+    TICK_PEN = QPen(QColor("#666"))
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.blocks: List[MemoryBlock] = []
         self.total_size = 1024
-        self.process_colors = {}
+        self.process_colors = {}  # 进程名 -> 填充画刷
         self.color_index = 0
         self.setMinimumHeight(100)
         self.setMinimumWidth(600)
+        # paintEvent 自行填充背景，无需 Qt 预先擦除
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self._label_font = QFont("Microsoft YaHei", 8)
+        self._tick_font = QFont("Microsoft YaHei", 7)
+        self._label_metrics = QFontMetrics(self._label_font)
+        self._labels: List[tuple] = []  # 各内存块的 (名称, 名称宽度)
+        self._ticks: List[tuple] = self._build_ticks(self.total_size)  # 地址刻度的 (地址, 文字)
+
+        # 内存块布局只在数据或尺寸变化时改变，缓存为位图
+        self._static_pixmap: Optional[QPixmap] = None
 
     def set_data(self, blocks: List[MemoryBlock], total_size: int):
         """设置数据"""
         self.blocks = blocks
+        if total_size != self.total_size:
+            self._ticks = self._build_ticks(total_size)
         self.total_size = total_size
-        self._assign_colors()
+
+        # 一次遍历中为新出现的进程分配颜色并测量名称宽度
+        self._labels = []
+        for block in blocks:
+            if block.is_free:
+                text = "空闲"
+            else:
+                text = block.process_name
+                if text not in self.process_colors:
+                    self._assign_color(text)
+            self._labels.append((text, self._label_metrics.horizontalAdvance(text)))
+        self._static_pixmap = None
         self.update()
 
-    def _assign_colors(self):
+    @staticmethod
+    def _build_ticks(total_size: int) -> List[tuple]:
+        """将地址空间八等分，生成刻度位置和文字"""
+        step = max(total_size // 8, 1)
+        return [(address, str(address)) for address in range(0, total_size + 1, step)]
+
+    def _assign_color(self, process_name: str):
         """为进程分配颜色"""
-        for block in self.blocks:
-            if not block.is_free and block.process_name not in self.process_colors:
-                self.process_colors[block.process_name] = PROCESS_COLORS[
-                    self.color_index % len(PROCESS_COLORS)
-                ]
-                self.color_index += 1
+        self.process_colors[process_name] = self.PROCESS_BRUSHES[
+            self.color_index % len(self.PROCESS_BRUSHES)
+        ]
+        self.color_index += 1
 
     def paintEvent(self, event):
         """绘制内存块"""
+        if self._static_pixmap is None:
+            self._static_pixmap = self._render_static()
         painter = QPainter(self)
+        painter.fillRect(event.rect(), self.palette().window())
+        painter.drawPixmap(0, 0, self._static_pixmap)
+
+    def resizeEvent(self, event):
+        """尺寸变化时重建位图"""
+        self._static_pixmap = None
+        super().resizeEvent(event)
+
+    def _render_static(self) -> QPixmap:
+        """将内存块、文字和地址刻度绘制到位图中"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
+        self._draw_blocks(painter)
+        painter.end()
+        return pixmap
 
+    def _draw_blocks(self, painter: QPainter):
+        """绘制边框、内存块和地址刻度"""
         width = self.width() - 20
         height = self.height() - 40
         start_x = 10
         start_y = 20
 
         # 绘制边框
-        painter.setPen(QPen(QColor("#333"), 2))
+        painter.setPen(self.BORDER_PEN)
         painter.drawRect(start_x, start_y, width, height)
 
-        # 绘制每个内存块
+        # 计算各内存块的位置，并按填充画刷归类，每种颜色一次 drawRects
+        blocks_by_brush = {}
+        spans = []
         for block in self.blocks:
             x = start_x + (block.start / self.total_size) * width
             w = (block.size / self.total_size) * width
+            spans.append((block, x, w))
 
             if block.is_free:
-                color = QColor("#E8E8E8")
+                brush = self.FREE_BRUSH
             else:
-                color = QColor(self.process_colors.get(block.process_name, "#999"))
-
-            painter.setBrush(QBrush(color))
-            painter.setPen(QPen(QColor("#666"), 1))
-            painter.drawRect(int(x), start_y, int(w), height)
-
-            # 绘制文字
-            font = QFont("Microsoft YaHei", 8)
-            painter.setFont(font)
-            painter.setPen(QPen(QColor("#333")))
-
-            text = "空闲" if block.is_free else block.process_name
-            size_text = f"{block.size}KB"
-
-            fm = QFontMetrics(font)
-            if w > fm.horizontalAdvance(text) + 10:
+                brush = self.process_colors.get(block.process_name, self.UNKNOWN_BRUSH)
+            # QBrush 不可哈希，以对象标识归类
+            rects = blocks_by_brush.setdefault(id(brush), (brush, []))[1]
+            rects.append(QRect(int(x), start_y, int(w), height))
+
+        painter.setPen(self.BLOCK_PEN)
+        for brush, rects in blocks_by_brush.values():
+            painter.setBrush(brush)
+            painter.drawRects(rects)
+
+        # 绘制文字（名称宽度已在 set_data 中算好）
+        painter.setFont(self._label_font)
+        painter.setPen(self.TEXT_PEN)
+
+        for (block, x, w), (text, text_width) in zip(spans, self._labels):
+            if w > text_width + 10:
                 painter.drawText(
                     QRectF(x, start_y, w, height / 2),
                     Qt.AlignCenter,
@@ -101,22 +159,37 @@ class MemoryBlockWidget(QWidget):
                 painter.drawText(
                     QRectF(x, start_y + height / 2, w, height / 2),
                     Qt.AlignCenter,
-                    size_text
+                    f"{block.size}KB"
                 )
 
         # 绘制地址刻度
-        painter.setFont(QFont("Microsoft YaHei", 7))
-        painter.setPen(QPen(QColor("#666")))
+        painter.setFont(self._tick_font)
+        painter.setPen(self.TICK_PEN)
 
-        for i in range(0, self.total_size + 1, self.total_size // 8):
-            x = start_x + (i / self.total_size) * width
+        for address, text in self._ticks:
+            x = start_x + (address / self.total_size) * width
             painter.drawLine(int(x), start_y + height, int(x), start_y + height + 5)
-            painter.drawText(int(x - 15), start_y + height + 15, f"{i}")
+            painter.drawText(int(x - 15), start_y + height + 15, text)
 
 
 class PageFrameWidget(QWidget):
     """页框可视化组件"""
 
+    # 页框的填充色，按下标索引
+    FRAME_EMPTY, FRAME_HIT, FRAME_LOADED, FRAME_REPLACED, FRAME_NORMAL = range(5)
+    FRAME_BRUSHES = (
+        QBrush(QColor("#E8E8E8")),  # 空帧
+        QBrush(QColor("#4CAF50")),  # 命中 - 绿色
+        QBrush(QColor("#2196F3")),  # 新加入 - 蓝色
+        QBrush(QColor("#F44336")),  # 被替换 - 红色
+        QBrush(QColor("#FFD700")),  # 普通页 - 金色
+    )
+    FRAME_PEN = QPen(QColor("#333"), 2)
+    PAGE_PEN = QPen(QColor("#333"))
+    EMPTY_PAGE_PEN = QPen(QColor("#999"))
+    LABEL_PEN = QPen(QColor("#666"))
+    POINTER_PEN = QPen(QColor("#E91E63"), 2)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.frames: List[int] = []  # 页号列表
@@ -128,6 +201,9 @@ class PageFrameWidget(QWidget):
         self.reference_bits = {}
         self.setMinimumHeight(120)
         self.setMinimumWidth(400)
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self._page_font = QFont("Microsoft YaHei", 10, QFont.Bold)
+        self._label_font = QFont("Microsoft YaHei", 8)
 
     def set_data(self, frames: List[int], current_page: int = -1,
                  is_hit: bool = False, replaced: int = -1,
@@ -145,6 +221,7 @@ class PageFrameWidget(QWidget):
     def paintEvent(self, event):
         """绘制页框"""
         painter = QPainter(self)
+        painter.fillRect(event.rect(), self.palette().window())
         painter.setRenderHint(QPainter.Antialiasing)
 
         if not self.frames:
@@ -155,45 +232,49 @@ class PageFrameWidget(QWidget):
         start_x = (self.width() - frame_width * self.frame_count) // 2
         start_y = 30
 
-        font = QFont("Microsoft YaHei", 10, QFont.Bold)
-        painter.setFont(font)
-
+        # 按填充色归类页框，每种颜色只切换一次画刷
+        frames = [[] for _ in self.FRAME_BRUSHES]
         for i, page_id in enumerate(self.frames):
             x = start_x + i * frame_width
             rect = QRectF(x, start_y, frame_width - 5, frame_height)
 
             # 确定颜色
             if page_id == -1:
-                color = QColor("#E8E8E8")
+                kind = self.FRAME_EMPTY
             elif page_id == self.current_page:
-                if self.is_hit:
-                    color = QColor("#4CAF50")  # 命中 - 绿色
-                else:
-                    color = QColor("#2196F3")  # 新加入 - 蓝色
+                kind = self.FRAME_HIT if self.is_hit else self.FRAME_LOADED
             elif page_id == self.replaced_page:
-                color = QColor("#F44336")  # 被替换 - 红色
+                kind = self.FRAME_REPLACED
             else:
-                color = QColor("#FFD700")  # 普通页 - 金色
-
-            painter.setBrush(QBrush(color))
-            painter.setPen(QPen(QColor("#333"), 2))
-            painter.drawRoundedRect(rect, 5, 5)
-
-            # 绘制页号
-            painter.setPen(QPen(QColor("#333" if page_id != -1 else "#999")))
-            text = str(page_id) if page_id != -1 else "-"
-            painter.drawText(rect, Qt.AlignCenter, text)
-
-            # 绘制帧号标签
-            painter.setFont(QFont("Microsoft YaHei", 8))
-            painter.setPen(QPen(QColor("#666")))
+                kind = self.FRAME_NORMAL
+            frames[kind].append((rect, page_id))
+
+        painter.setPen(self.FRAME_PEN)
+        for brush, items in zip(self.FRAME_BRUSHES, frames):
+            painter.setBrush(brush)
+            for rect, _ in items:
+                painter.drawRoundedRect(rect, 5, 5)
+
+        # 绘制页号（空帧显示灰色的 "-"）
+        painter.setFont(self._page_font)
+        painter.setPen(self.EMPTY_PAGE_PEN)
+        for rect, _ in frames[self.FRAME_EMPTY]:
+            painter.drawText(rect, Qt.AlignCenter, "-")
+        painter.setPen(self.PAGE_PEN)
+        for items in frames[self.FRAME_EMPTY + 1:]:
+            for rect, page_id in items:
+                painter.drawText(rect, Qt.AlignCenter, str(page_id))
+
+        # 绘制帧号标签和引用位（如果有）
+        painter.setFont(self._label_font)
+        painter.setPen(self.LABEL_PEN)
+        for i, page_id in enumerate(self.frames):
+            x = start_x + i * frame_width
             painter.drawText(
                 QRectF(x, start_y - 20, frame_width - 5, 20),
                 Qt.AlignCenter,
                 f"帧{i}"
             )
-
-            # 绘制引用位（如果有）
             if page_id in self.reference_bits:
                 ref_bit = self.reference_bits[page_id]
                 painter.drawText(
@@ -202,50 +283,98 @@ class PageFrameWidget(QWidget):
                     f"R={ref_bit}"
                 )
 
-            # 绘制时钟指针
-            if self.clock_pointer == i:
-                painter.setPen(QPen(QColor("#E91E63"), 2))
-                painter.drawText(
-                    QRectF(x, start_y + frame_height + 15, frame_width - 5, 20),
-                    Qt.AlignCenter,
-                    "^"
-                )
-
-            painter.setFont(font)
+        # 绘制时钟指针
+        if 0 <= self.clock_pointer < self.frame_count:
+            x = start_x + self.clock_pointer * frame_width
+            painter.setPen(self.POINTER_PEN)
+            painter.drawText(
+                QRectF(x, start_y + frame_height + 15, frame_width - 5, 20),
+                Qt.AlignCenter,
+                "^"
+            )
 
 
 class PageAccessHistoryWidget(QWidget):
     """页面访问历史可视化"""
 
+    CELL_WIDTH = 45
+    CELL_HEIGHT = 25
+    START_X = 60
+    START_Y = 30
+
+    # 表格单元格的背景色，按下标索引
+    CELL_EMPTY, CELL_HIT, CELL_LOADED, CELL_REPLACED, CELL_NORMAL = range(5)
+    CELL_BRUSHES = (
+        QBrush(QColor("#F5F5F5")),  # 空帧
+        QBrush(QColor("#C8E6C9")),  # 命中 - 浅绿
+        QBrush(QColor("#BBDEFB")),  # 调入 - 浅蓝
+        QBrush(QColor("#FFCDD2")),  # 被替换 - 浅红
+        QBrush(QColor("#FFF9C4")),  # 普通 - 浅黄
+    )
+    CELL_PEN = QPen(QColor("#CCC"))
+    TEXT_PEN = QPen(QColor("#333"))
+    CURRENT_BRUSH = QBrush(QColor("#2196F3"))
+    CURRENT_TEXT_PEN = QPen(QColor("#FFF"))
+    HIT_PEN = QPen(QColor("#4CAF50"))
+    MISS_PEN = QPen(QColor("#F44336"))
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.history: List[dict] = []
         self.current_step = -1
         self.setMinimumHeight(150)
+        # 内容固定以左上角为原点，放大时只需绘制新露出的区域
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_StaticContents, True)
+        self._text_font = QFont("Microsoft YaHei", 9)
+        self._legend_font = QFont("Microsoft YaHei", 8)
 
     def set_data(self, history: List[dict], current_step: int = -1):
         """设置数据"""
-        self.history = history
+        self.history = list(history)
         self.current_step = current_step
         # 动态调整宽度
         self.setMinimumWidth(max(600, len(history) * 50 + 100))
         self.update()
 
+    def append_step(self, step: dict, index: int):
+        """追加一步访问记录，只重绘新增列及上一高亮列"""
+        if index != len(self.history):
+            # 与已有历史不连续，按前 index 步重新设置
+            self.set_data(self.history[:index] + [step], index)
+            return
+
+        self.history.append(step)
+        previous_step = self.current_step
+        self.current_step = index
+        self.setMinimumWidth(max(600, len(self.history) * 50 + 100))
+
+        if len(self.history) == 1:
+            # 首列需要同时绘制行标题和图例
+            self.update()
+            return
+
+        first_col = min(index, previous_step) if previous_step >= 0 else index
+        last_col = max(index, previous_step)
+        x = self.START_X + first_col * self.CELL_WIDTH
+        width = (last_col - first_col + 1) * self.CELL_WIDTH
+        self.update(QRect(x, 0, width, self.height()))
+
     def paintEvent(self, event):
         """绘制访问历史"""
         painter = QPainter(self)
+        painter.fillRect(event.rect(), self.palette().window())
         painter.setRenderHint(QPainter.Antialiasing)
 
         if not self.history:
             return
 
-        cell_width = 45
-        cell_height = 25
-        start_x = 60
-        start_y = 30
+        cell_width = self.CELL_WIDTH
+        cell_height = self.CELL_HEIGHT
+        start_x = self.START_X
+        start_y = self.START_Y
 
-        font = QFont("Microsoft YaHei", 9)
-        painter.setFont(font)
+        painter.setFont(self._text_font)
 
         # 获取帧数
         if self.history:
@@ -253,31 +382,45 @@ class PageAccessHistoryWidget(QWidget):
         else:
             frame_count = 4
 
+        # 只绘制与重绘区域相交的列（滚动时通常只露出一小段）；
+        # 抗锯齿边框会越过列边界半个像素，因此两侧各多取一个像素
+        exposed = event.rect()
+        first_col = max(0, (exposed.left() - 1 - start_x) // cell_width)
+        last_col = min(len(self.history), (exposed.right() + 1 - start_x) // cell_width + 1)
+        visible_cols = range(first_col, last_col)
+
         # 绘制列标题（页面访问序列）
-        painter.setPen(QPen(QColor("#333")))
-        for i, step in enumerate(self.history):
+        painter.setPen(self.TEXT_PEN)
+        for i in visible_cols:
+            step = self.history[i]
             x = start_x + i * cell_width
             rect = QRectF(x, 5, cell_width, 20)
 
             # 高亮当前步骤
             if i == self.current_step:
-                painter.setBrush(QBrush(QColor("#2196F3")))
+                painter.setBrush(self.CURRENT_BRUSH)
                 painter.drawRect(rect)
-                painter.setPen(QPen(QColor("#FFF")))
+                painter.setPen(self.CURRENT_TEXT_PEN)
             else:
-                painter.setPen(QPen(QColor("#333")))
+                painter.setPen(self.TEXT_PEN)
 
             painter.drawText(rect, Qt.AlignCenter, str(step['page']))
 
-        # 绘制行标题（帧号）
-        painter.setPen(QPen(QColor("#333")))
-        for i in range(frame_count):
-            y = start_y + i * cell_height
-            painter.drawText(QRectF(5, y, 50, cell_height), Qt.AlignVCenter, f"帧 {i}")
-
-        # 绘制表格内容
-        for col, step in enumerate(self.history):
+        # 绘制行标题（帧号），只在重绘区域包含左侧标题栏时绘制
+        if exposed.left() < start_x:
+            painter.setPen(self.TEXT_PEN)
+            for i in range(frame_count):
+                y = start_y + i * cell_height
+                painter.drawText(QRectF(5, y, 50, cell_height), Qt.AlignVCenter, f"帧 {i}")
+
+        # 绘制表格内容：按背景色归类单元格，每种颜色一次 drawRects
+        cells = [[] for _ in self.CELL_BRUSHES]
+        texts = []
+        for col in visible_cols:
+            step = self.history[col]
             x = start_x + col * cell_width
+            page = step['page']
+            replaced = step.get('replaced', -1)
 
             for row, page_id in enumerate(step['frame_state']):
                 y = start_y + row * cell_height
@@ -285,43 +428,46 @@ class PageAccessHistoryWidget(QWidget):
 
                 # 确定背景色
                 if page_id == -1:
-                    bg_color = QColor("#F5F5F5")
-                elif page_id == step['page']:
-                    if step['hit']:
-                        bg_color = QColor("#C8E6C9")  # 命中 - 浅绿
-                    else:
-                        bg_color = QColor("#BBDEFB")  # 调入 - 浅蓝
-                elif page_id == step.get('replaced', -1):
-                    bg_color = QColor("#FFCDD2")  # 被替换 - 浅红
+                    cells[self.CELL_EMPTY].append(rect)
+                    continue
+                if page_id == page:
+                    kind = self.CELL_HIT if step['hit'] else self.CELL_LOADED
+                elif page_id == replaced:
+                    kind = self.CELL_REPLACED
                 else:
-                    bg_color = QColor("#FFF9C4")  # 普通 - 浅黄
-
-                painter.setBrush(QBrush(bg_color))
-                painter.setPen(QPen(QColor("#CCC")))
-                painter.drawRect(rect)
-
-                # 绘制页号
-                painter.setPen(QPen(QColor("#333")))
-                text = str(page_id) if page_id != -1 else ""
-                painter.drawText(rect, Qt.AlignCenter, text)
+                    kind = self.CELL_NORMAL
+                cells[kind].append(rect)
+                texts.append((rect, str(page_id)))
+
+        painter.setPen(self.CELL_PEN)
+        for brush, rects in zip(self.CELL_BRUSHES, cells):
+            if rects:
+                painter.setBrush(brush)
+                painter.drawRects(rects)
+
+        # 绘制页号
+        painter.setPen(self.TEXT_PEN)
+        for rect, text in texts:
+            painter.drawText(rect, Qt.AlignCenter, text)
 
         # 绘制命中/缺失标记
         y = start_y + frame_count * cell_height + 5
-        for col, step in enumerate(self.history):
+        for col in visible_cols:
+            step = self.history[col]
             x = start_x + col * cell_width
             rect = QRectF(x, y, cell_width - 2, 20)
 
             if step['hit']:
-                painter.setPen(QPen(QColor("#4CAF50")))
+                painter.setPen(self.HIT_PEN)
                 text = "H"
             else:
-                painter.setPen(QPen(QColor("#F44336")))
+                painter.setPen(self.MISS_PEN)
                 text = "M"
 
             painter.drawText(rect, Qt.AlignCenter, text)
 
         # 图例
-        painter.setFont(QFont("Microsoft YaHei", 8))
-        painter.setPen(QPen(QColor("#333")))
+        painter.setFont(self._legend_font)
+        painter.setPen(self.TEXT_PEN)
         legend_y = start_y + frame_count * cell_height + 30
         painter.drawText(10, legend_y, "H: 命中  M: 缺失")
@@ -3,11 +3,9 @@
 """
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
 from PyQt5.QtGui import QPainter, QPen, QBrush, QColor, QFont, QPainterPath
-from PyQt5.QtCore import Qt, QPointF, QRectF, QTimer
+from PyQt5.QtCore import Qt, QPointF, QRect, QRectF
 import math
 from typing import List, Optional
-import sys
-sys.path.append('..')
 from core.synchronization import PhilosopherState
 
 
@@ -20,11 +18,27 @@ class PhilosopherTableWidget(QWidget):
         PhilosopherState.HUNGRY: QColor(243, 156, 18),      # 橙色 - 饥饿
         PhilosopherState.EATING: QColor(39, 174, 96),       # 绿色 - 进餐
     }
+    UNKNOWN_COLOR = QColor(150, 150, 150)
+    # 与状态颜色对应的哲学家边框和填充
+    STATE_PENS = {state: QPen(color.darker(120), 2) for state, color in STATE_COLORS.items()}
+    STATE_BRUSHES = {state: QBrush(color) for state, color in STATE_COLORS.items()}
+    UNKNOWN_PEN = QPen(UNKNOWN_COLOR.darker(120), 2)
+    UNKNOWN_BRUSH = QBrush(UNKNOWN_COLOR)
+
+    TABLE_PEN = QPen(QColor(139, 90, 43), 4)
+    TABLE_BRUSH = QBrush(QColor(205, 133, 63))
+    FORK_AVAILABLE_PEN = QPen(QColor(192, 192, 192), 3)  # 银色 - 可用
+    FORK_TAKEN_PEN = QPen(QColor(220, 80, 80), 3)        # 红色 - 被占用
+    NAME_PEN = QPen(QColor(255, 255, 255))
+    TEXT_PEN = QPen(QColor(60, 60, 60))
 
     def __init__(self, num_philosophers: int = 5, parent=None):
         super().__init__(parent)
         self.num_philosophers = num_philosophers
         self.setMinimumSize(400, 400)
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self._name_font = QFont("Microsoft YaHei", 9, QFont.Bold)
+        self._fork_font = QFont("Microsoft YaHei", 7)
 
         # 哲学家状态
         self.philosopher_states: List[PhilosopherState] = [
@@ -36,21 +50,32 @@ class PhilosopherTableWidget(QWidget):
         # 信号量值
         self.semaphore_values: List[int] = [1] * num_philosophers
 
-        # 动画定时器
-        self._timer = QTimer()
-        self._timer.timeout.connect(self.update)
+        # 哲学家、叉子和叉子齿的方向 (cos, sin)，只依赖哲学家数量
+        self._philosopher_dirs: List[tuple] = []
+        self._fork_dirs: List[tuple] = []
+        self._tooth_dirs: List[List[tuple]] = []
+        self._build_directions()
+
+        # 各哲学家（含状态文字）和叉子（含编号）的重绘区域，尺寸变化时重算
+        self._philosopher_rects: List[QRect] = []
+        self._fork_rects: List[QRect] = []
+        self._layout_items()
 
     def set_philosopher_state(self, philosopher_id: int, state: PhilosopherState):
-        """设置哲学家状态"""
+        """设置哲学家状态（只重绘该哲学家）"""
         if 0 <= philosopher_id < self.num_philosophers:
+            if self.philosopher_states[philosopher_id] == state:
+                return
             self.philosopher_states[philosopher_id] = state
-            self.update()
+            self.update(self._philosopher_rects[philosopher_id])
 
     def set_fork_state(self, fork_id: int, available: bool):
-        """设置叉子状态"""
+        """设置叉子状态（只重绘该叉子）"""
         if 0 <= fork_id < self.num_philosophers:
+            if self.fork_available[fork_id] == available:
+                return
             self.fork_available[fork_id] = available
-            self.update()
+            self.update(self._fork_rects[fork_id])
 
     def set_all_states(self, states: List[PhilosopherState]):
         """设置所有哲学家状态"""
@@ -58,29 +83,68 @@ class PhilosopherTableWidget(QWidget):
         self.update()
 
     def set_fork_states(self, states: List[dict]):
-        """设置所有叉子状态"""
+        """设置所有叉子状态（只重绘状态变化的叉子）"""
         for state in states:
-            fork_id = state.get("id", 0)
-            available = state.get("available", True)
-            if 0 <= fork_id < self.num_philosophers:
-                self.fork_available[fork_id] = available
-        self.update()
+            self.set_fork_state(state.get("id", 0), state.get("available", True))
 
     def set_semaphore_values(self, values: List[int]):
-        """设置信号量值"""
+        """设置信号量值（不在餐桌上绘制，无需重绘）"""
         self.semaphore_values = values[:self.num_philosophers]
-        self.update()
 
-    def start_animation(self):
-        """启动刷新动画"""
-        self._timer.start(100)
+    def _build_directions(self):
+        """预先计算各哲学家、叉子及叉子齿的方向（从顶部开始顺时针）"""
+        n = self.num_philosophers
+        self._philosopher_dirs = []
+        self._fork_dirs = []
+        self._tooth_dirs = []
+        for i in range(n):
+            angle = -math.pi / 2 + 2 * math.pi * i / n
+            self._philosopher_dirs.append((math.cos(angle), math.sin(angle)))
+
+            # 叉子位置在两个哲学家之间
+            angle = -math.pi / 2 + 2 * math.pi * (i + 0.5) / n
+            self._fork_dirs.append((math.cos(angle), math.sin(angle)))
+            self._tooth_dirs.append([(math.cos(angle + offset), math.sin(angle + offset))
+                                     for offset in (-0.3, 0, 0.3)])
+
+    def resizeEvent(self, event):
+        """尺寸变化时重算各项的重绘区域"""
+        self._layout_items()
+        super().resizeEvent(event)
+
+    def _layout_items(self):
+        """计算每个哲学家和叉子的包围矩形"""
+        center_x = self.width() // 2
+        center_y = self.height() // 2
+        table_radius = min(center_x, center_y) - 80
+        philosopher_radius = 30
+        fork_length = 25
 
-    def stop_animation(self):
-        """停止刷新动画"""
-        self._timer.stop()
+        self._philosopher_rects = []
+        radius = table_radius + 50
+        for cos_a, sin_a in self._philosopher_dirs:
+            x = center_x + radius * cos_a
+            y = center_y + radius * sin_a
+            # 圆形本体及下方的状态文字
+            rect = QRectF(x - philosopher_radius, y - philosopher_radius,
+                          philosopher_radius * 2, philosopher_radius * 2 + 25)
+            self._philosopher_rects.append(rect.toAlignedRect().adjusted(-3, -3, 3, 3))
+
+        self._fork_rects = []
+        for cos_a, sin_a in self._fork_dirs:
+            x = center_x + (table_radius - 20) * cos_a
+            y = center_y + (table_radius - 20) * sin_a
+            # 叉子柄、齿和编号文字
+            reach = fork_length + 8
+            rect = QRectF(QPointF(x, y), QPointF(x + reach * cos_a, y + reach * sin_a)).normalized()
+            num_x = x - 15 * cos_a
+            num_y = y - 15 * sin_a
+            rect |= QRectF(num_x - 8, num_y - 10, 22, 16)
+            self._fork_rects.append(rect.toAlignedRect().adjusted(-8, -8, 8, 8))
 
     def paintEvent(self, event):
         painter = QPainter(self)
+        painter.fillRect(event.rect(), self.palette().window())
         painter.setRenderHint(QPainter.Antialiasing)
 
         # 计算中心和半径
@@ -101,80 +165,74 @@ class PhilosopherTableWidget(QWidget):
 
     def _draw_table(self, painter: QPainter, cx: int, cy: int, radius: int):
         """绘制圆桌"""
-        painter.setPen(QPen(QColor(139, 90, 43), 4))
-        painter.setBrush(QBrush(QColor(205, 133, 63)))
+        painter.setPen(self.TABLE_PEN)
+        painter.setBrush(self.TABLE_BRUSH)
         painter.drawEllipse(QPointF(cx, cy), radius, radius)
 
     def _draw_philosophers(self, painter: QPainter, cx: int, cy: int,
                            radius: int, p_radius: int):
-        """绘制哲学家"""
-        font = QFont("Microsoft YaHei", 9, QFont.Bold)
-        painter.setFont(font)
-
-        for i in range(self.num_philosophers):
+        """绘制哲学家（圆形、编号、状态文字分三遍绘制，每遍只设置一次画笔）"""
+        name_rects = []
+        state_texts = []
+        for i, (cos_a, sin_a) in enumerate(self._philosopher_dirs):
             # 计算位置（从顶部开始顺时针）
-            angle = -math.pi / 2 + 2 * math.pi * i / self.num_philosophers
-            x = cx + radius * math.cos(angle)
-            y = cy + radius * math.sin(angle)
+            x = cx + radius * cos_a
+            y = cy + radius * sin_a
 
-            # 获取状态颜色
+            # 获取状态
             state = self.philosopher_states[i] if i < len(self.philosopher_states) else PhilosopherState.THINKING
-            color = self.STATE_COLORS.get(state, QColor(150, 150, 150))
 
             # 绘制圆形（哲学家）
-            painter.setPen(QPen(color.darker(120), 2))
-            painter.setBrush(QBrush(color))
+            painter.setPen(self.STATE_PENS.get(state, self.UNKNOWN_PEN))
+            painter.setBrush(self.STATE_BRUSHES.get(state, self.UNKNOWN_BRUSH))
             painter.drawEllipse(QPointF(x, y), p_radius, p_radius)
 
-            # 绘制编号
-            painter.setPen(QPen(QColor(255, 255, 255)))
-            rect = QRectF(x - p_radius, y - p_radius, p_radius * 2, p_radius * 2)
+            name_rects.append(QRectF(x - p_radius, y - p_radius, p_radius * 2, p_radius * 2))
+            state_text = state.value if state else "思考"
+            state_texts.append((QRectF(x - 25, y + p_radius + 5, 50, 20), state_text))
+
+        painter.setFont(self._name_font)
+
+        # 绘制编号
+        painter.setPen(self.NAME_PEN)
+        for i, rect in enumerate(name_rects):
             painter.drawText(rect, Qt.AlignCenter, f"P{i}")
 
-            # 绘制状态文字
-            painter.setPen(QPen(QColor(60, 60, 60)))
-            state_text = state.value if state else "思考"
-            text_rect = QRectF(x - 25, y + p_radius + 5, 50, 20)
+        # 绘制状态文字
+        painter.setPen(self.TEXT_PEN)
+        for text_rect, state_text in state_texts:
             painter.drawText(text_rect, Qt.AlignCenter, state_text)
 
     def _draw_forks(self, painter: QPainter, cx: int, cy: int,
                     table_radius: int, fork_length: int):
         """绘制叉子"""
-        for i in range(self.num_philosophers):
+        for i, (cos_a, sin_a) in enumerate(self._fork_dirs):
             # 叉子位置在两个哲学家之间
-            angle = -math.pi / 2 + 2 * math.pi * (i + 0.5) / self.num_philosophers
-            x = cx + (table_radius - 20) * math.cos(angle)
-            y = cy + (table_radius - 20) * math.sin(angle)
+            x = cx + (table_radius - 20) * cos_a
+            y = cy + (table_radius - 20) * sin_a
 
             # 叉子是否可用
             available = self.fork_available[i] if i < len(self.fork_available) else True
 
-            if available:
-                color = QColor(192, 192, 192)  # 银色 - 可用
-            else:
-                color = QColor(220, 80, 80)    # 红色 - 被占用
-
             # 绘制叉子（简化为线条+圆点）
-            painter.setPen(QPen(color, 3))
+            painter.setPen(self.FORK_AVAILABLE_PEN if available else self.FORK_TAKEN_PEN)
 
             # 叉子柄
-            end_x = x + fork_length * math.cos(angle)
-            end_y = y + fork_length * math.sin(angle)
+            end_x = x + fork_length * cos_a
+            end_y = y + fork_length * sin_a
             painter.drawLine(int(x), int(y), int(end_x), int(end_y))
 
             # 叉子齿
-            for offset in [-0.3, 0, 0.3]:
-                tooth_angle = angle + offset
-                tooth_x = end_x + 8 * math.cos(tooth_angle)
-                tooth_y = end_y + 8 * math.sin(tooth_angle)
+            for tooth_cos, tooth_sin in self._tooth_dirs[i]:
+                tooth_x = end_x + 8 * tooth_cos
+                tooth_y = end_y + 8 * tooth_sin
                 painter.drawLine(int(end_x), int(end_y), int(tooth_x), int(tooth_y))
 
             # 绘制叉子编号
-            painter.setPen(QPen(QColor(60, 60, 60)))
-            font = QFont("Microsoft YaHei", 7)
-            painter.setFont(font)
-            num_x = x - 15 * math.cos(angle)
-            num_y = y - 15 * math.sin(angle)
+            painter.setPen(self.TEXT_PEN)
+            painter.setFont(self._fork_font)
+            num_x = x - 15 * cos_a
+            num_y = y - 15 * sin_a
             painter.drawText(int(num_x - 8), int(num_y + 4), f"F{i}")
 
     def reset(self):
@@ -1,17 +1,19 @@
 """
 进程队列动画组件
 """
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame
-from PyQt5.QtGui import QPainter, QPen, QBrush, QColor, QFont
-from PyQt5.QtCore import Qt, QRectF, QPropertyAnimation, QEasingCurve, pyqtProperty
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QSizePolicy
+from PyQt5.QtGui import QPainter, QPen, QBrush, QColor, QFont, QPixmap, QPixmapCache
+from PyQt5.QtCore import Qt, QRectF, QSize, QPropertyAnimation, QEasingCurve, pyqtProperty
 from typing import List, Optional
-import sys
-sys.path.append('..')
 from core.process import Process, ProcessState
 
 
-class ProcessBlock(QWidget):
-    """进程块组件"""
+class ProcessRowCanvas(QWidget):
+    """进程块画布（在一次绘制中画出队列中的所有进程块）"""
+
+    BLOCK_WIDTH = 60
+    BLOCK_HEIGHT = 50
+    BLOCK_SPACING = 5
 
     STATE_COLORS = {
         ProcessState.CREATED: QColor(150, 150, 150),
@@ -20,36 +22,81 @@ class ProcessBlock(QWidget):
         ProcessState.BLOCKED: QColor(220, 180, 100),
         ProcessState.TERMINATED: QColor(180, 100, 100),
     }
+    TEXT_PEN = QPen(QColor(255, 255, 255))
 
-    def __init__(self, process: Process, parent=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.process = process
-        self.setFixedSize(60, 50)
+        self.processes: List[Process] = []
+        self._shown: list = []  # 上次显示的 (PID, 状态, 名称)
+        self._text_font = QFont("Microsoft YaHei", 8, QFont.Bold)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+
+    def set_processes(self, processes: List[Process]):
+        """设置进程列表，显示内容变化时才重绘"""
+        self.processes = list(processes)
+        shown = [(p.pid, p.state, p.name) for p in processes]
+        if shown == self._shown:
+            return
+        if len(shown) != len(self._shown):
+            self.setMinimumWidth(self._min_width())
+            self.updateGeometry()
+        self._shown = shown
+        self.update()
+
+    def _min_width(self) -> int:
+        """所有进程块紧密排列时所需的宽度"""
+        return max(len(self.processes) * (self.BLOCK_WIDTH + self.BLOCK_SPACING)
+                   - self.BLOCK_SPACING, 0)
+
+    def sizeHint(self) -> QSize:
+        return QSize(self._min_width(), self.BLOCK_HEIGHT)
 
     def paintEvent(self, event):
         painter = QPainter(self)
+        pitch = self.BLOCK_WIDTH + self.BLOCK_SPACING
+        ratio = self.devicePixelRatioF()
+        for i, process in enumerate(self.processes):
+            painter.drawPixmap(i * pitch, 0, self._block_pixmap(process, ratio))
+
+    def _block_pixmap(self, process: Process, ratio: float) -> QPixmap:
+        """取得进程块位图（外观只取决于状态、PID 和名称，放入全局位图缓存）"""
+        name = process.name[:4] if len(process.name) > 4 else process.name
+        key = f"process_block:{process.state.name}:{process.pid}:{name}@{ratio}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = self._render_block(process, name, ratio)
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def _render_block(self, process: Process, name: str, ratio: float) -> QPixmap:
+        """将一个进程块绘制到位图中"""
+        pixmap = QPixmap(QSize(self.BLOCK_WIDTH, self.BLOCK_HEIGHT) * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
 
         # 获取状态颜色
-        color = self.STATE_COLORS.get(self.process.state, QColor(150, 150, 150))
+        color = self.STATE_COLORS.get(process.state, QColor(150, 150, 150))
 
         # 绘制圆角矩形
         painter.setPen(QPen(color.darker(120), 2))
         painter.setBrush(QBrush(color))
-        rect = QRectF(2, 2, self.width() - 4, self.height() - 4)
+        rect = QRectF(2, 2, self.BLOCK_WIDTH - 4, self.BLOCK_HEIGHT - 4)
         painter.drawRoundedRect(rect, 5, 5)
 
         # 绘制进程信息
-        painter.setPen(QPen(QColor(255, 255, 255)))
-        font = QFont("Microsoft YaHei", 8, QFont.Bold)
-        painter.setFont(font)
+        painter.setPen(self.TEXT_PEN)
+        painter.setFont(self._text_font)
 
         # PID
         painter.drawText(rect.adjusted(0, 5, 0, 0), Qt.AlignHCenter | Qt.AlignTop,
-                        f"P{self.process.pid}")
+                        f"P{process.pid}")
         # 名称（简化）
-        name = self.process.name[:4] if len(self.process.name) > 4 else self.process.name
         painter.drawText(rect.adjusted(0, 0, 0, -5), Qt.AlignHCenter | Qt.AlignBottom, name)
+        painter.end()
+        return pixmap
 
 
 class QueueWidget(QWidget):
@@ -87,7 +134,8 @@ class QueueWidget(QWidget):
         self.process_layout = QHBoxLayout(self.process_container)
         self.process_layout.setContentsMargins(5, 5, 5, 5)
         self.process_layout.setSpacing(5)
-        self.process_layout.addStretch()
+        self.process_canvas = ProcessRowCanvas()
+        self.process_layout.addWidget(self.process_canvas)
 
         # 边框
         self.process_container.setStyleSheet("""
@@ -102,17 +150,7 @@ class QueueWidget(QWidget):
     def set_processes(self, processes: List[Process]):
         """设置进程列表"""
         self.processes = processes
-
-        # 清除现有组件
-        while self.process_layout.count() > 1:
-            item = self.process_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # 添加新的进程块
-        for process in processes:
-            block = ProcessBlock(process)
-            self.process_layout.insertWidget(self.process_layout.count() - 1, block)
+        self.process_canvas.set_processes(processes)
 
         # 更新标题
         self.title_label.setText(f"{self.title} ({len(processes)})")
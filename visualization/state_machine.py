@@ -2,9 +2,10 @@
 进程状态机可视化组件
 """
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
-from PyQt5.QtGui import QPainter, QPen, QBrush, QColor, QFont, QPainterPath
-from PyQt5.QtCore import Qt, QRectF, QPointF, QTimer
+from PyQt5.QtGui import QPainter, QPen, QBrush, QColor, QFont, QPainterPath, QPixmap
+from PyQt5.QtCore import Qt, QRect, QRectF, QPointF, QTimer
 import math
+from typing import Optional
 
 
 class StateMachineWidget(QWidget):
@@ -18,6 +19,18 @@ class StateMachineWidget(QWidget):
         "阻塞": QColor(220, 180, 100),    # 黄色
         "终止": QColor(180, 100, 100),    # 红色
     }
+    # 节点填充（普通 / 当前状态）
+    STATE_BRUSHES = {name: QBrush(color) for name, color in STATE_COLORS.items()}
+    CURRENT_BRUSHES = {name: QBrush(color.lighter(120)) for name, color in STATE_COLORS.items()}
+    NODE_PEN = QPen(QColor(60, 60, 60), 2)
+    CURRENT_NODE_PEN = QPen(QColor(255, 100, 100), 4)
+    NODE_TEXT_PEN = QPen(QColor(255, 255, 255))
+
+    EDGE_PEN = QPen(QColor(100, 100, 100), 2)
+    EDGE_BRUSH = QBrush(QColor(100, 100, 100))
+    HIGHLIGHT_EDGE_PEN = QPen(QColor(255, 100, 100), 3)
+    HIGHLIGHT_EDGE_BRUSH = QBrush(QColor(255, 100, 100))
+    EDGE_LABEL_PEN = QPen(QColor(80, 80, 80))
 
     # 状态位置（相对于中心）
     STATE_POSITIONS = {
@@ -41,73 +54,146 @@ class StateMachineWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(450, 280)
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self._node_font = QFont("Microsoft YaHei", 10, QFont.Bold)
+        self._label_font = QFont("Microsoft YaHei", 8)
         self.current_state = None
         self._highlight_transition = None
         self._animation_timer = QTimer()
         self._animation_timer.timeout.connect(self._clear_highlight)
 
+        # 未高亮的状态图只随尺寸变化，缓存为位图；高亮部分每次叠加绘制
+        self._static_pixmap: Optional[QPixmap] = None
+        # 各转换的 (起点, 终点, 线段端点, 箭头路径, 标签位置)，尺寸变化时重算
+        self._edge_geom: list = []
+        # 各状态节点和转换箭头的重绘区域，高亮变化时只重绘这些区域
+        self._node_rects: dict = {}
+        self._edge_rects: dict = {}
+        self._layout_graph()
+
     def set_current_state(self, state_name: str):
-        """设置当前高亮状态"""
+        """设置当前高亮状态（只重绘新旧两个节点）"""
+        if state_name == self.current_state:
+            return
+        dirty = self._node_rect(self.current_state) | self._node_rect(state_name)
         self.current_state = state_name
-        self.update()
+        self.update(dirty)
 
     def highlight_transition(self, from_state: str, to_state: str):
         """高亮状态转换"""
-        self._highlight_transition = (from_state, to_state)
-        self.update()
+        self._set_highlight((from_state, to_state))
         self._animation_timer.start(1000)
 
     def _clear_highlight(self):
         """清除高亮"""
-        self._highlight_transition = None
         self._animation_timer.stop()
-        self.update()
+        self._set_highlight(None)
+
+    def _set_highlight(self, transition: Optional[tuple]):
+        """切换高亮的转换（只重绘新旧两条箭头）"""
+        if transition == self._highlight_transition:
+            return
+        dirty = self._edge_rect(self._highlight_transition) | self._edge_rect(transition)
+        self._highlight_transition = transition
+        self.update(dirty)
+
+    def _node_rect(self, state_name: Optional[str]) -> QRect:
+        """状态节点的重绘区域"""
+        return self._node_rects.get(state_name, QRect())
+
+    def _edge_rect(self, transition: Optional[tuple]) -> QRect:
+        """转换箭头的重绘区域"""
+        return self._edge_rects.get(transition, QRect())
+
+    def resizeEvent(self, event):
+        """尺寸变化时重算布局并重建静态位图"""
+        self._layout_graph()
+        super().resizeEvent(event)
+
+    def _layout_graph(self):
+        """计算箭头几何和各节点、箭头的重绘区域"""
+        self._layout_edges()
+        self._static_pixmap = None
+
+        center_x = self.width() // 2
+        center_y = self.height() // 2
+        # 节点半径 35，高亮边框宽 4
+        self._node_rects = {
+            state_name: QRect(center_x + dx - 38, center_y + dy - 38, 76, 76)
+            for state_name, (dx, dy) in self.STATE_POSITIONS.items()
+        }
+        self._edge_rects = {}
+        for from_state, to_state, line, arrow, _ in self._edge_geom:
+            x1, y1, x2, y2 = line
+            rect = QRectF(QPointF(x1, y1), QPointF(x2, y2)).normalized() | arrow.boundingRect()
+            self._edge_rects[(from_state, to_state)] = rect.toAlignedRect().adjusted(-3, -3, 3, 3)
 
     def paintEvent(self, event):
+        if self._static_pixmap is None:
+            self._static_pixmap = self._render_static()
+
         painter = QPainter(self)
+        painter.fillRect(event.rect(), self.palette().window())
+        painter.drawPixmap(0, 0, self._static_pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
 
-        # 计算中心点
-        center_x = self.width() // 2
-        center_y = self.height() // 2
+        # 叠加高亮的转换箭头
+        if self._highlight_transition:
+            for from_state, to_state, line, arrow, _ in self._edge_geom:
+                if (from_state, to_state) == self._highlight_transition:
+                    self._draw_edge(painter, line, arrow, True)
 
-        # 绘制状态转换箭头
-        self._draw_transitions(painter, center_x, center_y)
+        # 叠加当前状态节点
+        if self.current_state in self.STATE_POSITIONS:
+            self._draw_state(painter, self.current_state, True)
+
+    def _render_static(self) -> QPixmap:
+        """将未高亮的转换箭头和状态节点绘制到位图中"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
 
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        # 绘制状态转换箭头
+        self._draw_transitions(painter)
         # 绘制状态节点
-        self._draw_states(painter, center_x, center_y)
+        for state_name in self.STATE_POSITIONS:
+            self._draw_state(painter, state_name, False)
+        painter.end()
+        return pixmap
 
-    def _draw_states(self, painter: QPainter, center_x: int, center_y: int):
-        """绘制状态节点"""
+    def _draw_state(self, painter: QPainter, state_name: str, is_current: bool):
+        """绘制一个状态节点"""
         node_radius = 35
-        font = QFont("Microsoft YaHei", 10, QFont.Bold)
-        painter.setFont(font)
-
-        for state_name, (dx, dy) in self.STATE_POSITIONS.items():
-            x = center_x + dx
-            y = center_y + dy
-
-            # 设置颜色
-            color = self.STATE_COLORS.get(state_name, QColor(150, 150, 150))
-
-            # 当前状态高亮
-            if state_name == self.current_state:
-                painter.setPen(QPen(QColor(255, 100, 100), 4))
-                painter.setBrush(QBrush(color.lighter(120)))
-            else:
-                painter.setPen(QPen(QColor(60, 60, 60), 2))
-                painter.setBrush(QBrush(color))
-
-            # 绘制圆形节点
-            painter.drawEllipse(QPointF(x, y), node_radius, node_radius)
-
-            # 绘制状态名称
-            painter.setPen(QPen(QColor(255, 255, 255)))
-            rect = QRectF(x - node_radius, y - node_radius, node_radius * 2, node_radius * 2)
-            painter.drawText(rect, Qt.AlignCenter, state_name)
-
-    def _draw_transitions(self, painter: QPainter, center_x: int, center_y: int):
-        """绘制状态转换箭头"""
+        dx, dy = self.STATE_POSITIONS[state_name]
+        x = self.width() // 2 + dx
+        y = self.height() // 2 + dy
+
+        # 当前状态高亮
+        if is_current:
+            painter.setPen(self.CURRENT_NODE_PEN)
+            painter.setBrush(self.CURRENT_BRUSHES[state_name])
+        else:
+            painter.setPen(self.NODE_PEN)
+            painter.setBrush(self.STATE_BRUSHES[state_name])
+
+        # 绘制圆形节点
+        painter.drawEllipse(QPointF(x, y), node_radius, node_radius)
+
+        # 绘制状态名称
+        painter.setPen(self.NODE_TEXT_PEN)
+        painter.setFont(self._node_font)
+        rect = QRectF(x - node_radius, y - node_radius, node_radius * 2, node_radius * 2)
+        painter.drawText(rect, Qt.AlignCenter, state_name)
+
+    def _layout_edges(self):
+        """计算各转换箭头的线段、箭头头部和标签位置"""
+        center_x = self.width() // 2
+        center_y = self.height() // 2
+        self._edge_geom = []
+
         for from_state, to_state, label in self.TRANSITIONS:
             from_pos = self.STATE_POSITIONS[from_state]
             to_pos = self.STATE_POSITIONS[to_state]
@@ -117,16 +203,6 @@ class StateMachineWidget(QWidget):
             x2 = center_x + to_pos[0]
             y2 = center_y + to_pos[1]
 
-            # 检查是否高亮
-            is_highlight = (self._highlight_transition and
-                           self._highlight_transition[0] == from_state and
-                           self._highlight_transition[1] == to_state)
-
-            if is_highlight:
-                painter.setPen(QPen(QColor(255, 100, 100), 3))
-            else:
-                painter.setPen(QPen(QColor(100, 100, 100), 2))
-
             # 计算箭头方向
             dx = x2 - x1
             dy = y2 - y1
@@ -144,11 +220,9 @@ class StateMachineWidget(QWidget):
             start_y = y1 + dy * node_radius
             end_x = x2 - dx * node_radius
             end_y = y2 - dy * node_radius
+            line = (int(start_x), int(start_y), int(end_x), int(end_y))
 
-            # 绘制线段
-            painter.drawLine(int(start_x), int(start_y), int(end_x), int(end_y))
-
-            # 绘制箭头头部
+            # 箭头头部
             arrow_size = 10
             angle = math.atan2(dy, dx)
             arrow_p1_x = end_x - arrow_size * math.cos(angle - math.pi / 6)
@@ -156,26 +230,39 @@ class StateMachineWidget(QWidget):
             arrow_p2_x = end_x - arrow_size * math.cos(angle + math.pi / 6)
             arrow_p2_y = end_y - arrow_size * math.sin(angle + math.pi / 6)
 
-            path = QPainterPath()
-            path.moveTo(end_x, end_y)
-            path.lineTo(arrow_p1_x, arrow_p1_y)
-            path.lineTo(arrow_p2_x, arrow_p2_y)
-            path.closeSubpath()
-
-            if is_highlight:
-                painter.setBrush(QBrush(QColor(255, 100, 100)))
-            else:
-                painter.setBrush(QBrush(QColor(100, 100, 100)))
-            painter.drawPath(path)
+            arrow = QPainterPath()
+            arrow.moveTo(end_x, end_y)
+            arrow.lineTo(arrow_p1_x, arrow_p1_y)
+            arrow.lineTo(arrow_p2_x, arrow_p2_y)
+            arrow.closeSubpath()
 
-            # 绘制标签
+            # 标签位于线段中点的法向偏移处
             mid_x = (start_x + end_x) / 2
             mid_y = (start_y + end_y) / 2
-            painter.setPen(QPen(QColor(80, 80, 80)))
-            font = QFont("Microsoft YaHei", 8)
-            painter.setFont(font)
-
-            # 偏移标签位置
             offset_x = -dy * 15
             offset_y = dx * 15
-            painter.drawText(int(mid_x + offset_x - 25), int(mid_y + offset_y + 5), label)
+            label_pos = (int(mid_x + offset_x - 25), int(mid_y + offset_y + 5), label)
+
+            self._edge_geom.append((from_state, to_state, line, arrow, label_pos))
+
+    def _draw_transitions(self, painter: QPainter):
+        """绘制状态转换箭头（未高亮）"""
+        for _, _, line, arrow, (label_x, label_y, label) in self._edge_geom:
+            self._draw_edge(painter, line, arrow, False)
+
+            # 绘制标签
+            painter.setPen(self.EDGE_LABEL_PEN)
+            painter.setFont(self._label_font)
+            painter.drawText(label_x, label_y, label)
+
+    def _draw_edge(self, painter: QPainter, line: tuple, arrow: QPainterPath,
+                   is_highlight: bool):
+        """绘制一条转换线段及其箭头头部"""
+        if is_highlight:
+            painter.setPen(self.HIGHLIGHT_EDGE_PEN)
+            painter.setBrush(self.HIGHLIGHT_EDGE_BRUSH)
+        else:
+            painter.setPen(self.EDGE_PEN)
+            painter.setBrush(self.EDGE_BRUSH)
+        painter.drawLine(*line)
+        painter.drawPath(arrow)